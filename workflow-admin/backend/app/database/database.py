@@ -6,12 +6,15 @@ with environment-based configuration switching.
 """
 
 from sqlalchemy import create_engine, MetaData, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, Session
 from contextlib import contextmanager
+import json
 import os
-from typing import Generator, Optional
+from typing import Any, AsyncGenerator, Generator, Optional
 import logging
+import orjson
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +22,38 @@ logger = logging.getLogger(__name__)
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite:///./data/local/workflow-admin.db")
 CLOUD_DATABASE_URL = os.getenv("CLOUD_DATABASE_URL", "")
 
+# PostgreSQL pool settings: libpq TCP keepalives detect dead connections,
+# so checkouts skip the pre-ping SELECT and stale connections are recycled.
+# LIFO checkout keeps reusing the same warm backends (plan/relation caches)
+# and lets surplus connections sit idle until recycled.
+POSTGRES_CONNECT_ARGS = {"keepalives": 1, "keepalives_idle": 30, "keepalives_interval": 10, "keepalives_count": 5}
+POSTGRES_POOL_ARGS = {
+    "pool_size": 20,
+    "max_overflow": 10,
+    "pool_timeout": 30,
+    "pool_recycle": 300,
+    "pool_pre_ping": False,
+    "pool_use_lifo": True,
+}
+
+
+def _json_serializer(value: Any) -> str:
+    """orjson encoder for JSON columns; non-str keys are coerced like the stdlib encoder does"""
+    try:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    except TypeError:
+        # orjson rejects integers wider than 64 bits, which the stdlib encodes fine
+        return json.dumps(value)
+
+
+# JSON columns (definition, content, configuration, ...) are encoded by orjson
+# on every engine. Decoding stays on the stdlib: orjson turns integers wider
+# than 64 bits into floats without raising, and rejects NaN/Infinity that
+# stdlib-written rows may hold
+JSON_ARGS = {"json_serializer": _json_serializer, "json_deserializer": json.loads}
+
 # SQLite specific settings
+pool_args = {}
 if DATABASE_URL.startswith("sqlite"):
     connect_args = {"check_same_thread": False}
     # Ensure directory exists for SQLite
@@ -27,6 +61,9 @@ if DATABASE_URL.startswith("sqlite"):
     db_dir = os.path.dirname(db_path)
     if db_dir and not os.path.exists(db_dir):
         os.makedirs(db_dir, exist_ok=True)
+elif DATABASE_URL.startswith("postgresql"):
+    connect_args = POSTGRES_CONNECT_ARGS
+    pool_args = POSTGRES_POOL_ARGS
 else:
     connect_args = {}
 
@@ -34,12 +71,34 @@ else:
 engine = create_engine(
     DATABASE_URL,
     connect_args=connect_args,
+    **pool_args,
+    **JSON_ARGS,
+    insertmanyvalues_page_size=1000,  # Rows per multi-VALUES batch for bulk inserts
     echo=os.getenv("SQL_ECHO", "false").lower() == "true"
 )
 
 # Create SessionLocal class
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Async engine over the same database for endpoints that run on the event loop
+ASYNC_DRIVERS = {"sqlite": "sqlite+aiosqlite", "postgresql": "postgresql+asyncpg"}
+
+
+def get_async_url(url: str) -> str:
+    """Swap a database URL's driver for its asyncio equivalent"""
+    scheme, rest = url.split("://", 1)
+    return f"{ASYNC_DRIVERS.get(scheme.split('+')[0], scheme)}://{rest}"
+
+
+# asyncpg has no libpq keepalive options, so only the pool settings carry over
+async_engine = create_async_engine(
+    get_async_url(DATABASE_URL),
+    **pool_args,
+    **JSON_ARGS,
+    echo=os.getenv("SQL_ECHO", "false").lower() == "true"
+)
+AsyncSessionLocal = async_sessionmaker(async_engine, autoflush=False)
+
 # Optional cloud engine for sync
 cloud_engine = None
 CloudSessionLocal = None
@@ -48,6 +107,9 @@ if CLOUD_DATABASE_URL:
     try:
         cloud_engine = create_engine(
             CLOUD_DATABASE_URL,
+            connect_args=POSTGRES_CONNECT_ARGS,
+            **POSTGRES_POOL_ARGS,
+            **JSON_ARGS,
             echo=os.getenv("SQL_ECHO", "false").lower() == "true"
         )
         CloudSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=cloud_engine)
@@ -68,6 +130,15 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """
+    Get async database session
+    Used as dependency in async FastAPI endpoints
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
 def get_cloud_db() -> Generator[Optional[Session], None, None]:
     """
     Get cloud database session (if available)
@@ -0,0 +1,48 @@
+"""unique category and name on organizational contexts
+
+Contexts are created with INSERT ... ON CONFLICT (category, name), which
+needs this constraint. Databases created before it was declared on the
+model get it here, after duplicate (category, name) rows are removed;
+the lowest id of each group is kept.
+
+Revision ID: f051ff802d9e
+Revises: 
+Create Date: 2026-10-16 07:29:01.300248
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f051ff802d9e'
+down_revision = None
+branch_labels = None
+depends_on = None
+
+
+def _needs_constraint() -> bool:
+    """False when the table doesn't exist yet or create_all already built the constraint"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("organizational_contexts"):
+        return False
+    constraints = inspector.get_unique_constraints("organizational_contexts")
+    return not any(constraint["name"] == "uq_org_ctx_category_name" for constraint in constraints)
+
+
+def upgrade() -> None:
+    if not _needs_constraint():
+        return
+    op.execute(
+        "DELETE FROM organizational_contexts WHERE id NOT IN ("
+        "SELECT MIN(id) FROM organizational_contexts GROUP BY category, name)"
+    )
+    # Batch mode recreates the table on SQLite, which has no ADD CONSTRAINT;
+    # on PostgreSQL it is a plain ALTER TABLE ... ADD CONSTRAINT
+    with op.batch_alter_table("organizational_contexts") as batch_op:
+        batch_op.create_unique_constraint("uq_org_ctx_category_name", ["category", "name"])
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("organizational_contexts") as batch_op:
+        batch_op.drop_constraint("uq_org_ctx_category_name", type_="unique")
@@ -0,0 +1,46 @@
+"""denormalized agent_type_name on agents
+
+Agent listings read the type name from agents.agent_type_name instead of
+joining agent_types. Databases created before the column was declared
+on the model get it here, indexed, and backfilled from agent_types;
+from then on the agent writes keep it in sync.
+
+Revision ID: 8a034622f8b8
+Revises: f051ff802d9e
+Create Date: 2026-10-16 07:36:57.373265
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8a034622f8b8'
+down_revision = 'f051ff802d9e'
+branch_labels = None
+depends_on = None
+
+
+def _has_column() -> bool:
+    """True when the table doesn't exist yet or create_all already added the column"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("agents"):
+        return True
+    return any(column["name"] == "agent_type_name" for column in inspector.get_columns("agents"))
+
+
+def upgrade() -> None:
+    if _has_column():
+        return
+    op.add_column("agents", sa.Column("agent_type_name", sa.String(length=100), nullable=True))
+    op.create_index("ix_agents_agent_type_name", "agents", ["agent_type_name"])
+    op.execute(
+        "UPDATE agents SET agent_type_name = "
+        "(SELECT name FROM agent_types WHERE agent_types.id = agents.agent_type_id)"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_agents_agent_type_name", table_name="agents")
+    with op.batch_alter_table("agents") as batch_op:
+        batch_op.drop_column("agent_type_name")
@@ -0,0 +1,120 @@
+"""timestamp columns on workflow runs and assignments
+
+The run and assignment timestamps were ISO strings. PostgreSQL converts
+them in place with USING ...::timestamptz. SQLite first rewrites each
+value in the format SQLAlchemy's DateTime reads back (UTC, no offset),
+then rebuilds the table with DATETIME columns; values that don't parse
+as ISO 8601 become NULL. PostgreSQL also gets the BRIN index on
+workflow_runs.started_at.
+
+Revision ID: 4347eb69009f
+Revises: 8a034622f8b8
+Create Date: 2026-10-16 07:38:08.560746
+
+"""
+from alembic import op
+from datetime import datetime, timezone
+import logging
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4347eb69009f'
+down_revision = '8a034622f8b8'
+branch_labels = None
+depends_on = None
+
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+TIMESTAMP_COLUMNS = {
+    "workflow_runs": ["started_at", "completed_at"],
+    "workflow_assignments": ["assigned_at", "started_at", "completed_at"],
+}
+
+
+def _string_columns(table: str) -> list:
+    """The table's timestamp columns still stored as strings; none if the table doesn't exist yet"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table(table):
+        return []
+    types = {column["name"]: column["type"] for column in inspector.get_columns(table)}
+    return [name for name in TIMESTAMP_COLUMNS[table] if isinstance(types.get(name), sa.String)]
+
+
+def _normalise(value):
+    """An ISO string as naive UTC in SQLite DATETIME storage format, or None if it doesn't parse"""
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value.strip())
+    except ValueError:
+        return None
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed.strftime("%Y-%m-%d %H:%M:%S.%f")
+
+
+def _normalise_sqlite_values(table: str, columns: list) -> None:
+    """Rewrite stored strings so the DateTime result processor can parse every row"""
+    connection = op.get_bind()
+    rows = connection.execute(sa.text(f"SELECT id, {', '.join(columns)} FROM {table}")).all()
+    for row in rows:
+        values = {}
+        for name, value in zip(columns, row[1:]):
+            values[name] = _normalise(value)
+            if value and values[name] is None:
+                logger.warning("%s.%s id=%s: %r is not an ISO timestamp, set to NULL", table, name, row[0], value)
+        connection.execute(
+            sa.text(f"UPDATE {table} SET {', '.join(f'{name} = :{name}' for name in columns)} WHERE id = :id"),
+            {"id": row[0], **values}
+        )
+
+
+def upgrade() -> None:
+    postgresql = op.get_bind().dialect.name == "postgresql"
+    for table in TIMESTAMP_COLUMNS:
+        columns = _string_columns(table)
+        if not columns:
+            continue
+        if postgresql:
+            for name in columns:
+                op.alter_column(
+                    table, name,
+                    type_=sa.DateTime(timezone=True),
+                    existing_type=sa.String(),
+                    postgresql_using=f"NULLIF({name}, '')::timestamptz"
+                )
+        else:
+            _normalise_sqlite_values(table, columns)
+            # The new types go in through reflect_args: alter_column would copy the
+            # rows through CAST(... AS DATETIME), whose numeric affinity mangles them
+            with op.batch_alter_table(
+                table,
+                recreate="always",
+                reflect_args=[sa.Column(name, sa.DateTime(timezone=True)) for name in columns]
+            ):
+                pass
+    
+    if postgresql and sa.inspect(op.get_bind()).has_table("workflow_runs"):
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_workflow_runs_started_brin "
+            "ON workflow_runs USING brin (started_at)"
+        )
+
+
+def downgrade() -> None:
+    postgresql = op.get_bind().dialect.name == "postgresql"
+    if postgresql:
+        op.execute("DROP INDEX IF EXISTS ix_workflow_runs_started_brin")
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if postgresql:
+            for name in columns:
+                op.alter_column(table, name, type_=sa.String(), existing_type=sa.DateTime(timezone=True))
+        else:
+            with op.batch_alter_table(
+                table,
+                recreate="always",
+                reflect_args=[sa.Column(name, sa.String()) for name in columns]
+            ):
+                pass
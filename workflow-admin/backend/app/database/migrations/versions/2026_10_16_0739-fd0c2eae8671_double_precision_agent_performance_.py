@@ -0,0 +1,65 @@
+"""double precision agent performance values
+
+agent_performance.value moves from NUMERIC(10, 4) to double precision,
+converted in place on PostgreSQL with USING value::double precision.
+SQLite already stores both as REAL or INTEGER, so its table is only
+rebuilt with the FLOAT declaration the model has.
+
+Revision ID: fd0c2eae8671
+Revises: 4347eb69009f
+Create Date: 2026-10-16 07:39:51.289221
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'fd0c2eae8671'
+down_revision = '4347eb69009f'
+branch_labels = None
+depends_on = None
+
+
+def _is_numeric() -> bool:
+    """True when agent_performance exists and value is still NUMERIC"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table("agent_performance"):
+        return False
+    value_type = next(column["type"] for column in inspector.get_columns("agent_performance") if column["name"] == "value")
+    # Float subclasses Numeric, so exclude it explicitly
+    return isinstance(value_type, sa.Numeric) and not isinstance(value_type, sa.Float)
+
+
+def upgrade() -> None:
+    if not _is_numeric():
+        return
+    if op.get_bind().dialect.name == "postgresql":
+        op.alter_column(
+            "agent_performance", "value",
+            type_=sa.Float(),
+            existing_type=sa.Numeric(10, 4),
+            existing_nullable=False,
+            postgresql_using="value::double precision"
+        )
+    else:
+        with op.batch_alter_table(
+            "agent_performance", recreate="always", reflect_args=[sa.Column("value", sa.Float(), nullable=False)]
+        ):
+            pass
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name == "postgresql":
+        op.alter_column(
+            "agent_performance", "value",
+            type_=sa.Numeric(10, 4),
+            existing_type=sa.Float(),
+            existing_nullable=False,
+            postgresql_using="value::numeric(10, 4)"
+        )
+    else:
+        with op.batch_alter_table(
+            "agent_performance", recreate="always", reflect_args=[sa.Column("value", sa.Numeric(10, 4), nullable=False)]
+        ):
+            pass
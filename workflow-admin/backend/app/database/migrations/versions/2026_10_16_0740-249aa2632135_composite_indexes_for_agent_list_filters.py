@@ -0,0 +1,44 @@
+"""composite indexes for agent list filters
+
+Indexes for the agent and agent type list filters, added to databases
+created before they were declared on the models. On PostgreSQL they are
+built CONCURRENTLY so writes to the tables aren't blocked.
+
+Revision ID: 249aa2632135
+Revises: 5480990c394a
+Create Date: 2026-10-16 07:40:46.642006
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '249aa2632135'
+down_revision = '5480990c394a'
+branch_labels = None
+depends_on = None
+
+
+# name: (table, columns)
+INDEXES = {
+    "ix_agent_types_active_name": ("agent_types", ["is_active", "name"]),
+    "ix_agents_status_type": ("agents", ["status", "agent_type_id"]),
+    "ix_agents_type_status": ("agents", ["agent_type_id", "status"]),
+}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    # CONCURRENTLY can't run inside the migration's transaction (PostgreSQL;
+    # SQLite ignores the option)
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in INDEXES.items():
+            if inspector.has_table(table):
+                op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in INDEXES.items():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,67 @@
+"""jsonb agent and workflow columns
+
+On PostgreSQL the agent and workflow JSON columns become JSONB
+(USING col::jsonb), and agents.specializations gets its GIN index,
+built CONCURRENTLY so agent writes aren't blocked. SQLite stores both
+as JSON text, so nothing changes there.
+
+Revision ID: 5480990c394a
+Revises: fd0c2eae8671
+Create Date: 2026-10-16 07:40:25.202232
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import JSONB
+
+
+# revision identifiers, used by Alembic.
+revision = '5480990c394a'
+down_revision = 'fd0c2eae8671'
+branch_labels = None
+depends_on = None
+
+
+JSONB_COLUMNS = {
+    "agent_types": ["capabilities", "workflow_preferences", "default_config"],
+    "agents": ["configuration", "credentials", "specializations", "performance_metrics"],
+    "agent_performance": ["context"],
+    "agent_contexts": ["context_data"],
+    "workflow_templates": ["definition"],
+    "workflows": ["definition", "agent_requirements"],
+    "workflow_nodes": ["config"],
+    "workflow_edges": ["conditions"],
+    "workflow_runs": ["context", "results", "execution_metadata"],
+    "workflow_steps": ["context_config", "input_schema", "output_schema", "agent_requirements", "conditional_logic"],
+    "workflow_assignments": ["context"],
+}
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    inspector = sa.inspect(op.get_bind())
+    for table, columns in JSONB_COLUMNS.items():
+        if not inspector.has_table(table):
+            continue
+        types = {column["name"]: column["type"] for column in inspector.get_columns(table)}
+        for name in columns:
+            if not isinstance(types[name], JSONB):
+                op.alter_column(table, name, type_=JSONB(), existing_type=sa.JSON(), postgresql_using=f"{name}::jsonb")
+    
+    if inspector.has_table("agents"):
+        # CONCURRENTLY can't run inside the migration's transaction
+        with op.get_context().autocommit_block():
+            op.create_index(
+                "ix_agents_specializations_gin", "agents", ["specializations"],
+                postgresql_using="gin", postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.drop_index("ix_agents_specializations_gin", table_name="agents", if_exists=True)
+    for table, columns in JSONB_COLUMNS.items():
+        for name in columns:
+            op.alter_column(table, name, type_=sa.JSON(), existing_type=JSONB(), postgresql_using=f"{name}::json")
@@ -0,0 +1,42 @@
+"""keyset index on agent status
+
+Index for keyset pagination of agents within a status filter, added to
+databases created before it was declared on the model. On PostgreSQL it
+is built CONCURRENTLY so agent writes aren't blocked.
+
+Revision ID: 1d38d462ff27
+Revises: 249aa2632135
+Create Date: 2026-10-16 07:41:09.111865
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '1d38d462ff27'
+down_revision = '249aa2632135'
+branch_labels = None
+depends_on = None
+
+
+# name: (table, columns)
+INDEXES = {
+    "ix_agents_status_id": ("agents", ["status", "id"]),
+}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    # CONCURRENTLY can't run inside the migration's transaction (PostgreSQL;
+    # SQLite ignores the option)
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in INDEXES.items():
+            if inspector.has_table(table):
+                op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in INDEXES.items():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,46 @@
+"""composite indexes for context, team and workflow list filters
+
+Indexes for the context, team, workflow and assignment list filters,
+added to databases created before they were declared on the models. On
+PostgreSQL they are built CONCURRENTLY so writes to the tables aren't
+blocked.
+
+Revision ID: 6209976f8528
+Revises: 1d38d462ff27
+Create Date: 2026-10-16 07:41:20.447061
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '6209976f8528'
+down_revision = '1d38d462ff27'
+branch_labels = None
+depends_on = None
+
+
+# name: (table, columns)
+INDEXES = {
+    "ix_org_ctx_active_cat_pri": ("organizational_contexts", ["is_active", "category", "priority"]),
+    "ix_teams_active_proj": ("teams", ["is_active", "project_id"]),
+    "ix_workflows_proj_status": ("workflows", ["project_id", "status"]),
+    "ix_workflow_assign_wf_status": ("workflow_assignments", ["workflow_id", "status"]),
+}
+
+
+def upgrade() -> None:
+    inspector = sa.inspect(op.get_bind())
+    # CONCURRENTLY can't run inside the migration's transaction (PostgreSQL;
+    # SQLite ignores the option)
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in INDEXES.items():
+            if inspector.has_table(table):
+                op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, (table, columns) in INDEXES.items():
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
@@ -19,7 +19,7 @@ from .workflow import (
 
 # Import any remaining models from the original file that weren't split
 # These can be moved to separate files later if needed
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, JSON, Numeric, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, JSON, Numeric, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from .base import BaseModel
@@ -60,6 +60,12 @@ class OrganizationalContext(BaseModel):
     applies_to = Column(JSON)  # Which agent types, projects, or workflows this applies to
     priority = Column(Integer, default=0)  # Higher numbers = higher priority
     
+    # Equality filters first, then the ORDER BY priority key
+    __table_args__ = (
+        Index("ix_org_ctx_active_cat_pri", "is_active", "category", "priority"),
+        UniqueConstraint("category", "name", name="uq_org_ctx_category_name"),
+    )
+    
     def __repr__(self):
         return f"<OrganizationalContext(id={self.id}, category='{self.category}', name='{self.name}')>"
 
@@ -2,10 +2,10 @@
 Agent-related database models
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, JSON, DateTime, Numeric
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Float, Index, event, inspect, select, update
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
-from .base import BaseModel
+from .base import BaseModel, JSONVariant
 
 
 class AgentType(BaseModel):
@@ -17,14 +17,19 @@ class AgentType(BaseModel):
     
     name = Column(String(100), nullable=False, unique=True, index=True)  # e.g., "Product Owner"
     description = Column(Text)
-    capabilities = Column(JSON, nullable=False)  # Skills, tools, integrations available
-    workflow_preferences = Column(JSON)  # Preferred workflow patterns and configurations
-    default_config = Column(JSON)  # Default configuration for agents of this type
+    capabilities = Column(JSONVariant, nullable=False)  # Skills, tools, integrations available
+    workflow_preferences = Column(JSONVariant)  # Preferred workflow patterns and configurations
+    default_config = Column(JSONVariant)  # Default configuration for agents of this type
     is_active = Column(Boolean, default=True)
     
     # Relationships
     agents = relationship("Agent", back_populates="agent_type")
     
+    # Composite index for the active_only filter on the list endpoint
+    __table_args__ = (
+        Index("ix_agent_types_active_name", "is_active", "name"),
+    )
+    
     def __repr__(self):
         return f"<AgentType(id={self.id}, name='{self.name}')>"
 
@@ -38,14 +43,15 @@ class Agent(BaseModel):
     
     name = Column(String(255), nullable=False, index=True)  # e.g., "AgentIan", "AgentPete"
     agent_type_id = Column(Integer, ForeignKey("agent_types.id"), nullable=False, index=True)
+    agent_type_name = Column(String(100), index=True)  # Denormalized AgentType.name, avoids join on list views
     description = Column(Text)
-    configuration = Column(JSON)  # Agent-specific settings and preferences
-    credentials = Column(JSON)  # API tokens, connection strings (encrypted)
+    configuration = Column(JSONVariant)  # Agent-specific settings and preferences
+    credentials = Column(JSONVariant)  # API tokens, connection strings (encrypted)
     status = Column(String(50), default="active", index=True)  # active, inactive, maintenance, error
     workload_capacity = Column(Integer, default=100)  # Maximum concurrent workflows
     current_workload = Column(Integer, default=0)  # Current active workflow count
-    specializations = Column(JSON)  # Specific skills or focus areas
-    performance_metrics = Column(JSON)  # Cached performance statistics
+    specializations = Column(JSONVariant)  # Specific skills or focus areas
+    performance_metrics = Column(JSONVariant)  # Cached performance statistics
     last_active = Column(DateTime(timezone=True))
     
     # Relationships
@@ -58,8 +64,17 @@ class Agent(BaseModel):
     # Agent Integration relationships
     contexts = relationship("AgentContext", back_populates="agent")
     
+    # Composite indexes for the status / agent_type_id list filters;
+    # GIN index for JSONB containment filters (PostgreSQL only)
+    __table_args__ = (
+        Index("ix_agents_status_type", "status", "agent_type_id"),
+        Index("ix_agents_type_status", "agent_type_id", "status"),
+        Index("ix_agents_status_id", "status", "id"),  # Keyset pagination within a status filter
+        Index("ix_agents_specializations_gin", "specializations", postgresql_using="gin").ddl_if(dialect="postgresql"),
+    )
+    
     def __repr__(self):
-        return f"<Agent(id={self.id}, name='{self.name}', type='{self.agent_type.name if self.agent_type else 'Unknown'}')>"
+        return f"<Agent(id={self.id}, name='{self.name}', type='{self.agent_type_name or 'Unknown'}')>"
 
 
 class AgentPerformance(BaseModel):
@@ -71,10 +86,10 @@ class AgentPerformance(BaseModel):
     
     agent_id = Column(Integer, ForeignKey("agents.id"), nullable=False, index=True)
     metric_type = Column(String(100), nullable=False, index=True)  # "completion_rate", "quality_score", etc.
-    value = Column(Numeric(10, 4), nullable=False)
+    value = Column(Float, nullable=False)  # Double precision: cheap to aggregate, serializes without Decimal
     measurement_period = Column(String(50))  # "daily", "weekly", "monthly"
     measurement_date = Column(DateTime(timezone=True), server_default=func.now())
-    context = Column(JSON)  # Additional context about the measurement
+    context = Column(JSONVariant)  # Additional context about the measurement
     
     # Relationships
     agent = relationship("Agent", back_populates="performance_records")
@@ -92,7 +107,7 @@ class AgentContext(BaseModel):
     
     agent_id = Column(Integer, ForeignKey("agents.id"), nullable=False, index=True)
     context_name = Column(String(255), nullable=False, index=True)
-    context_data = Column(JSON, nullable=False)
+    context_data = Column(JSONVariant, nullable=False)
     is_active = Column(Boolean, default=True)
     priority = Column(Integer, default=0)  # Higher numbers = higher priority
     
@@ -100,4 +115,37 @@ class AgentContext(BaseModel):
     agent = relationship("Agent", back_populates="contexts")
     
     def __repr__(self):
-        return f"<AgentContext(id={self.id}, agent_id={self.agent_id}, name='{self.context_name}')>"
\ No newline at end of file
+        return f"<AgentContext(id={self.id}, agent_id={self.agent_id}, name='{self.context_name}')>"
+
+
+# Keep Agent.agent_type_name in sync with AgentType.name
+def agent_type_name_subquery(agent_type_id):
+    """AgentType.name as a scalar subquery, read in the same statement that writes the agent"""
+    return select(AgentType.name).where(AgentType.id == agent_type_id).scalar_subquery()
+
+
+def rename_agent_type(connection, agent_type_id: int, name: str):
+    """Refresh the denormalized copy of the name on every agent of this type"""
+    connection.execute(
+        update(Agent.__table__)
+        .where(Agent.__table__.c.agent_type_id == agent_type_id)
+        .values(agent_type_name=name)
+    )
+
+
+@event.listens_for(Agent, "before_insert")
+def _set_agent_type_name(mapper, connection, target):
+    if target.agent_type_id is not None:
+        target.agent_type_name = agent_type_name_subquery(target.agent_type_id)
+
+
+@event.listens_for(Agent, "before_update")
+def _reset_agent_type_name(mapper, connection, target):
+    if inspect(target).attrs.agent_type_id.history.has_changes():
+        _set_agent_type_name(mapper, connection, target)
+
+
+@event.listens_for(AgentType, "after_update")
+def _propagate_agent_type_name(mapper, connection, target):
+    if inspect(target).attrs.name.history.has_changes():
+        rename_agent_type(connection, target.id, target.name)
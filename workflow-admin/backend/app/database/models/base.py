@@ -2,18 +2,23 @@
 Base database models and common utilities
 """
 
-from sqlalchemy import Column, Integer, String, DateTime
+from sqlalchemy import Column, Integer, String, DateTime, JSON
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.sql import func
 from datetime import datetime
 
 Base = declarative_base()
 
+# JSON on SQLite, binary JSONB (indexable with GIN) on PostgreSQL
+JSONVariant = JSON().with_variant(JSONB(), "postgresql")
+
 
 class TimestampMixin:
     """Mixin for adding timestamp fields to models"""
-    created_at = Column(DateTime, default=func.now(), nullable=False)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    # Client-side defaults: values are known before the INSERT/UPDATE, so
+    # instances aren't expired and re-SELECTed after flush
+    created_at = Column(DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
 
 class BaseModel(Base, TimestampMixin):
@@ -2,7 +2,7 @@
 Team-related database models
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, JSON, UniqueConstraint
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, JSON, UniqueConstraint, Index
 from sqlalchemy.orm import relationship
 from .base import BaseModel
 
@@ -27,8 +27,13 @@ class Team(BaseModel):
     members = relationship("TeamMember", back_populates="team", cascade="all, delete-orphan")
     workflows = relationship("Workflow", back_populates="assigned_team")
     
+    # Composite index for the active_only + project_id list filter
+    __table_args__ = (
+        Index("ix_teams_active_proj", "is_active", "project_id"),
+    )
+    
     def __repr__(self):
-        return f"<Team(id={self.id}, name='{self.name}', members={len(self.members) if self.members else 0})>"
+        return f"<Team(id={self.id}, name='{self.name}')>"
 
 
 class TeamMember(BaseModel):
@@ -2,9 +2,9 @@
 Workflow-related database models
 """
 
-from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, JSON
+from sqlalchemy import Column, Integer, String, Text, Boolean, ForeignKey, DateTime, Index
 from sqlalchemy.orm import relationship
-from .base import BaseModel
+from .base import BaseModel, JSONVariant
 
 
 class WorkflowTemplate(BaseModel):
@@ -17,7 +17,7 @@ class WorkflowTemplate(BaseModel):
     name = Column(String(255), nullable=False, index=True)
     description = Column(Text)
     category = Column(String(100), index=True)  # e.g., "product-owner", "developer", "general"
-    definition = Column(JSON, nullable=False)  # Template structure (nodes, edges, parameters)
+    definition = Column(JSONVariant, nullable=False)  # Template structure (nodes, edges, parameters)
     is_public = Column(Boolean, default=True)  # Whether template is available to all users
     created_by = Column(String(255))  # Future: user ID who created template
     
@@ -41,8 +41,8 @@ class Workflow(BaseModel):
     template_id = Column(Integer, ForeignKey("workflow_templates.id"), nullable=True, index=True)
     assigned_team_id = Column(Integer, ForeignKey("teams.id"), nullable=True, index=True)
     primary_agent_id = Column(Integer, ForeignKey("agents.id"), nullable=True, index=True)
-    definition = Column(JSON, nullable=False)  # Complete workflow: nodes, edges, variables, settings
-    agent_requirements = Column(JSON)  # Required agent types, skills, capabilities
+    definition = Column(JSONVariant, nullable=False)  # Complete workflow: nodes, edges, variables, settings
+    agent_requirements = Column(JSONVariant)  # Required agent types, skills, capabilities
     status = Column(String(50), default="draft", index=True)  # draft, active, archived
     version = Column(Integer, default=1)  # For workflow versioning
     created_by = Column(String(255))  # Future: user ID who created workflow
@@ -52,11 +52,17 @@ class Workflow(BaseModel):
     template = relationship("WorkflowTemplate", back_populates="workflows")
     assigned_team = relationship("Team", back_populates="workflows")
     primary_agent = relationship("Agent", foreign_keys=[primary_agent_id])
-    nodes = relationship("WorkflowNode", back_populates="workflow", cascade="all, delete-orphan")
-    edges = relationship("WorkflowEdge", back_populates="workflow", cascade="all, delete-orphan")
-    steps = relationship("WorkflowStep", back_populates="workflow", cascade="all, delete-orphan")
-    runs = relationship("WorkflowRun", back_populates="workflow", cascade="all, delete-orphan")
-    assignments = relationship("WorkflowAssignment", back_populates="workflow", cascade="all, delete-orphan")
+    # Child collections raise instead of lazy loading; callers opt in with selectinload()
+    nodes = relationship("WorkflowNode", back_populates="workflow", cascade="all, delete-orphan", lazy="raise_on_sql")
+    edges = relationship("WorkflowEdge", back_populates="workflow", cascade="all, delete-orphan", lazy="raise_on_sql")
+    steps = relationship("WorkflowStep", back_populates="workflow", cascade="all, delete-orphan", lazy="raise_on_sql")
+    runs = relationship("WorkflowRun", back_populates="workflow", cascade="all, delete-orphan", lazy="raise_on_sql")
+    assignments = relationship("WorkflowAssignment", back_populates="workflow", cascade="all, delete-orphan", lazy="raise_on_sql")
+    
+    # Composite index for the project_id + status list filter
+    __table_args__ = (
+        Index("ix_workflows_proj_status", "project_id", "status"),
+    )
     
     def __repr__(self):
         return f"<Workflow(id={self.id}, name='{self.name}', status='{self.status}')>"
@@ -75,7 +81,7 @@ class WorkflowNode(BaseModel):
     label = Column(String(255))  # Display name
     position_x = Column(Integer, default=0)  # X coordinate in visual editor
     position_y = Column(Integer, default=0)  # Y coordinate in visual editor
-    config = Column(JSON)  # Node-specific configuration
+    config = Column(JSONVariant)  # Node-specific configuration
     
     # Relationships
     workflow = relationship("Workflow", back_populates="nodes")
@@ -96,7 +102,7 @@ class WorkflowEdge(BaseModel):
     source_node_id = Column(String(100), nullable=False)  # References WorkflowNode.node_id
     target_node_id = Column(String(100), nullable=False)  # References WorkflowNode.node_id
     edge_type = Column(String(50), default="default")  # default, conditional, error, etc.
-    conditions = Column(JSON)  # Conditional logic for when this edge should be taken
+    conditions = Column(JSONVariant)  # Conditional logic for when this edge should be taken
     label = Column(String(255))  # Display label for the edge
     
     # Relationships
@@ -116,16 +122,21 @@ class WorkflowRun(BaseModel):
     workflow_id = Column(Integer, ForeignKey("workflows.id"), nullable=False, index=True)
     run_id = Column(String(100), nullable=False, unique=True, index=True)  # Unique identifier
     status = Column(String(50), default="running", index=True)  # running, completed, failed, cancelled
-    started_at = Column(String)  # ISO timestamp string
-    completed_at = Column(String)  # ISO timestamp string
-    context = Column(JSON)  # Input context/variables for the run
-    results = Column(JSON)  # Output results and intermediate states
+    started_at = Column(DateTime(timezone=True))
+    completed_at = Column(DateTime(timezone=True))
+    context = Column(JSONVariant)  # Input context/variables for the run
+    results = Column(JSONVariant)  # Output results and intermediate states
     error_log = Column(Text)  # Error messages and stack traces
-    execution_metadata = Column(JSON)  # Performance metrics, agent assignments, etc.
+    execution_metadata = Column(JSONVariant)  # Performance metrics, agent assignments, etc.
     
     # Relationships
     workflow = relationship("Workflow", back_populates="runs")
     
+    # BRIN index: runs are inserted in start order, so block ranges stay tight (PostgreSQL only)
+    __table_args__ = (
+        Index("ix_workflow_runs_started_brin", "started_at", postgresql_using="brin").ddl_if(dialect="postgresql"),
+    )
+    
     def __repr__(self):
         return f"<WorkflowRun(id={self.id}, run_id='{self.run_id}', status='{self.status}')>"
 
@@ -141,13 +152,13 @@ class WorkflowStep(BaseModel):
     step_name = Column(String(255), nullable=False, index=True)
     step_type = Column(String(100), nullable=False)  # "input", "process", "decision", "output"
     sequence_order = Column(Integer, nullable=False)  # Order within workflow
-    context_config = Column(JSON)  # Step-specific context and configuration
-    input_schema = Column(JSON)  # Expected input data structure
-    output_schema = Column(JSON)  # Expected output data structure
-    agent_requirements = Column(JSON)  # Required agent capabilities for this step
+    context_config = Column(JSONVariant)  # Step-specific context and configuration
+    input_schema = Column(JSONVariant)  # Expected input data structure
+    output_schema = Column(JSONVariant)  # Expected output data structure
+    agent_requirements = Column(JSONVariant)  # Required agent capabilities for this step
     estimated_duration = Column(Integer)  # Estimated completion time in minutes
     is_required = Column(Boolean, default=True)  # Whether this step can be skipped
-    conditional_logic = Column(JSON)  # Conditions for when this step should execute
+    conditional_logic = Column(JSONVariant)  # Conditions for when this step should execute
     
     # Relationships
     workflow = relationship("Workflow", back_populates="steps")
@@ -169,16 +180,21 @@ class WorkflowAssignment(BaseModel):
     assignment_type = Column(String(50), default="primary")  # primary, secondary, reviewer, consultant
     status = Column(String(50), default="assigned", index=True)  # assigned, in_progress, completed, cancelled
     priority = Column(String(20), default="medium")  # low, medium, high, urgent
-    assigned_at = Column(String)  # ISO timestamp
-    started_at = Column(String)  # When agent started working
-    completed_at = Column(String)  # When assignment was completed
+    assigned_at = Column(DateTime(timezone=True))
+    started_at = Column(DateTime(timezone=True))  # When agent started working
+    completed_at = Column(DateTime(timezone=True))  # When assignment was completed
     notes = Column(Text)  # Assignment-specific notes
-    context = Column(JSON)  # Assignment-specific context and parameters
+    context = Column(JSONVariant)  # Assignment-specific context and parameters
     
     # Relationships
     workflow = relationship("Workflow", back_populates="assignments")
     agent = relationship("Agent", back_populates="workflow_assignments", foreign_keys=[agent_id])
     assigned_by_agent = relationship("Agent", back_populates="assigned_workflows", foreign_keys=[assigned_by])
     
+    # Composite index for the per-workflow assignment listing with status filter
+    __table_args__ = (
+        Index("ix_workflow_assign_wf_status", "workflow_id", "status"),
+    )
+    
     def __repr__(self):
-        return f"<WorkflowAssignment(id={self.id}, workflow_id={self.workflow_id}, agent_id={self.agent_id})>"
\ No newline at end of file
+        return f"<WorkflowAssignment(id={self.id}, workflow_id={self.workflow_id}, agent_id={self.agent_id})>"
@@ -6,11 +6,15 @@ Multi-agent workflow management system
 from fastapi import FastAPI, Depends, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
+from datetime import datetime
+import os
 import uvicorn
 
+from .cache import TTLCache
 from .database.database import get_db, get_database_info, check_database_connection
 from .database.models import Base
 from .routers import projects, agents, teams, workflows, contexts
+from .routers.body import JSONResponse
 
 # Create FastAPI app
 app = FastAPI(
@@ -18,7 +22,8 @@ app = FastAPI(
     description="Multi-agent workflow management system with AI integration",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    default_response_class=JSONResponse  # orjson is much faster on the large JSON columns
 )
 
 # Add CORS middleware
@@ -28,6 +33,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Keyset cursor of the contexts listing
 )
 
 # Include routers
@@ -37,12 +43,24 @@ app.include_router(teams.router)
 app.include_router(workflows.router)
 app.include_router(contexts.router)
 
+# Coalesce bursts of health probes into at most one DB ping per TTL window
+_db_status_cache = TTLCache(maxsize=1, ttl=5.0)
+
+
+def _cached_db_ok() -> bool:
+    """Database connectivity, re-checked at most once per cache TTL"""
+    db_ok = _db_status_cache.get("ok")
+    if db_ok is None:
+        db_ok = check_database_connection()
+        _db_status_cache.set("ok", db_ok)
+    return db_ok
+
 # Health check endpoint
 @app.get("/health")
 async def health_check():
     """Health check endpoint for container and load balancer monitoring"""
     try:
-        db_status = check_database_connection()
+        db_status = _cached_db_ok()
         return {
             "status": "healthy" if db_status else "unhealthy",
             "database": {
@@ -69,7 +87,7 @@ async def api_info():
             "Performance analytics",
             "Hybrid database support"
         ],
-        "database_connected": check_database_connection(),
+        "database_connected": _cached_db_ok(),
         "endpoints": {
             "health": "/health",
             "docs": "/docs",
@@ -91,15 +109,18 @@ async def database_status():
         raise HTTPException(status_code=500, detail=f"Database status check failed: {str(e)}")
 
 # Version endpoint
+# Built once at import; BUILD_DATE is stamped by the image build when available
+_VERSION_INFO = {
+    "version": "1.0.0",
+    "buildDate": os.getenv("BUILD_DATE", datetime.now().strftime("%Y-%m-%d")),
+    "service": "workflow-admin-api"
+}
+
+
 @app.get("/api/v1/version")
 async def get_version():
     """Get application version information"""
-    from datetime import datetime
-    return {
-        "version": "1.0.0",
-        "buildDate": datetime.now().strftime("%Y-%m-%d"),
-        "service": "workflow-admin-api"
-    }
+    return _VERSION_INFO
 
 # Root endpoint
 @app.get("/")
@@ -2,31 +2,43 @@
 Agent management endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import insert, lambda_stmt, literal, select, update
+from sqlalchemy.orm import Session, raiseload
 from typing import List, Optional
 
 from ..database.database import get_db
 from ..database.models import Agent as AgentModel, AgentType as AgentTypeModel
-from ..schemas import Agent, AgentCreate, AgentUpdate, AgentType, AgentTypeCreate, AgentTypeUpdate, PaginatedResponse
+from ..database.models.agent import agent_type_name_subquery, rename_agent_type
+from .body import json_body, json_response
+from .pagination import paginate
+from ..schemas import (
+    Agent, AgentCreate, AgentUpdate, AgentType, AgentTypeCreate, AgentTypeUpdate, AgentTypePage, AgentPage
+)
 
 router = APIRouter(prefix="/api/v1/agents", tags=["agents"])
 
+# Bulk bodies are parsed and validated straight from bytes
+_agent_create_list = TypeAdapter(List[AgentCreate])
+_agent_list = TypeAdapter(List[Agent])
+
 # Agent Type endpoints
 @router.post("/types", response_model=AgentType)
 def create_agent_type(agent_type: AgentTypeCreate, db: Session = Depends(get_db)):
     """Create a new agent type"""
-    db_agent_type = AgentTypeModel(**agent_type.dict())
+    db_agent_type = AgentTypeModel(**agent_type.model_dump())
     db.add(db_agent_type)
     db.commit()
     db.refresh(db_agent_type)
-    return db_agent_type
+    return json_response(AgentType.from_orm_trusted(db_agent_type))
 
 
-@router.get("/types", response_model=PaginatedResponse)
+@router.get("/types", response_model=AgentTypePage)
 def get_agent_types(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[int] = Query(None, description="Keyset cursor: return items with id greater than this"),
     active_only: bool = Query(True),
     db: Session = Depends(get_db)
 ):
@@ -35,116 +47,200 @@ def get_agent_types(
     if active_only:
         query = query.filter(AgentTypeModel.is_active == True)
     
-    agent_types = query.offset(skip).limit(limit).all()
-    total = query.count()
+    agent_types, total, has_next = paginate(query, AgentTypeModel.id, skip, limit, after_id)
     
     # Convert SQLAlchemy models to Pydantic schemas
-    agent_type_schemas = [AgentType.from_orm(agent_type) for agent_type in agent_types]
+    agent_type_schemas = [AgentType.from_orm_trusted(agent_type) for agent_type in agent_types]
     
-    return PaginatedResponse(
+    # Typed page serialized straight to bytes: no response_model validation or jsonable_encoder pass
+    return json_response(AgentTypePage.model_construct(
         items=agent_type_schemas,
         total=total,
         page=skip // limit + 1,
-        size=limit,
-        pages=(total + limit - 1) // limit
-    )
+        per_page=limit,
+        has_next=has_next,
+        has_prev=skip > 0 or after_id is not None,
+        next_cursor=agent_type_schemas[-1].id if has_next else None
+    ))
 
 
 @router.get("/types/{agent_type_id}", response_model=AgentType)
 def get_agent_type(agent_type_id: int, db: Session = Depends(get_db)):
     """Get a specific agent type by ID"""
-    agent_type = db.query(AgentTypeModel).filter(AgentTypeModel.id == agent_type_id).first()
+    # lambda_stmt caches the built statement; only agent_type_id is re-bound per call
+    stmt = lambda_stmt(lambda: select(AgentTypeModel))
+    stmt += lambda s: s.where(AgentTypeModel.id == agent_type_id)
+    agent_type = db.execute(stmt).scalar_one_or_none()
     if not agent_type:
         raise HTTPException(status_code=404, detail="Agent type not found")
-    return agent_type
+    return json_response(AgentType.from_orm_trusted(agent_type))
 
 
 @router.put("/types/{agent_type_id}", response_model=AgentType)
 def update_agent_type(agent_type_id: int, agent_type_update: AgentTypeUpdate, db: Session = Depends(get_db)):
     """Update a specific agent type"""
-    db_agent_type = db.query(AgentTypeModel).filter(AgentTypeModel.id == agent_type_id).first()
+    update_data = agent_type_update.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_agent_type(agent_type_id, db)
+    
+    # Single UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+    db_agent_type = db.execute(
+        update(AgentTypeModel)
+        .where(AgentTypeModel.id == agent_type_id)
+        .values(**update_data)
+        .returning(AgentTypeModel)
+    ).scalar_one_or_none()
     if not db_agent_type:
         raise HTTPException(status_code=404, detail="Agent type not found")
     
-    update_data = agent_type_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_agent_type, field, value)
+    # Bulk UPDATE bypasses ORM events, so propagate a rename here
+    if "name" in update_data:
+        rename_agent_type(db.connection(), agent_type_id, db_agent_type.name)
     
+    agent_type_schema = AgentType.from_orm_trusted(db_agent_type)
     db.commit()
-    db.refresh(db_agent_type)
-    return db_agent_type
+    return json_response(agent_type_schema)
 
 
 # Agent endpoints
 @router.post("/", response_model=Agent)
 def create_agent(agent: AgentCreate, db: Session = Depends(get_db)):
     """Create a new agent"""
-    # Verify agent type exists
-    agent_type = db.query(AgentTypeModel).filter(AgentTypeModel.id == agent.agent_type_id).first()
-    if not agent_type:
+    # INSERT ... SELECT from agent_types: the type's existence check and the
+    # denormalized name are read in the same statement as the insert, and
+    # RETURNING hydrates server defaults without a follow-up refresh
+    values = agent.model_dump()
+    agent_table = AgentModel.__table__
+    db_agent = db.execute(
+        insert(AgentModel)
+        .from_select(
+            [*values, "agent_type_name"],
+            select(
+                *(literal(value, agent_table.c[key].type) for key, value in values.items()),
+                AgentTypeModel.name
+            ).where(AgentTypeModel.id == agent.agent_type_id)
+        )
+        .returning(AgentModel)
+    ).scalar_one_or_none()
+    if db_agent is None:
         raise HTTPException(status_code=400, detail="Agent type not found")
+    agent_schema = Agent.from_orm_trusted(db_agent)
+    db.commit()
+    return json_response(agent_schema)
+
+
+@router.post(
+    "/bulk",
+    response_model=List[Agent],
+    # The body is read by a dependency, so describe it for the OpenAPI docs here
+    openapi_extra={"requestBody": {"required": True, "content": {"application/json": {
+        "schema": {"type": "array", "items": {"$ref": "#/components/schemas/AgentCreate"}}
+    }}}}
+)
+def create_agents_bulk(
+    agents: List[AgentCreate] = Depends(json_body(_agent_create_list)),
+    db: Session = Depends(get_db)
+):
+    """Create many agents with a single multi-row INSERT ... RETURNING"""
+    if not agents:
+        return []
     
-    db_agent = AgentModel(**agent.dict())
-    db.add(db_agent)
+    # Verify all referenced agent types exist in one query
+    agent_type_ids = {agent.agent_type_id for agent in agents}
+    agent_type_names = dict(db.execute(
+        select(AgentTypeModel.id, AgentTypeModel.name).where(AgentTypeModel.id.in_(agent_type_ids))
+    ).all())
+    missing_ids = agent_type_ids - agent_type_names.keys()
+    if missing_ids:
+        raise HTTPException(status_code=400, detail=f"Agent type not found: {sorted(missing_ids)}")
+    
+    # Bulk INSERT bypasses ORM events, so fill the denormalized name here
+    db_agents = db.scalars(
+        insert(AgentModel).returning(AgentModel, sort_by_parameter_order=True),
+        [{**agent.model_dump(), "agent_type_name": agent_type_names[agent.agent_type_id]} for agent in agents]
+    ).all()
+    # Serialize before commit so expired attributes aren't reloaded row by row
+    agent_schemas = [Agent.from_orm_trusted(db_agent) for db_agent in db_agents]
     db.commit()
-    db.refresh(db_agent)
-    return db_agent
+    return Response(content=_agent_list.dump_json(agent_schemas), media_type="application/json")
 
 
-@router.get("/", response_model=PaginatedResponse)
+@router.get("/", response_model=AgentPage)
 def get_agents(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
+    after_id: Optional[int] = Query(None, description="Keyset cursor: return items with id greater than this"),
     status: Optional[str] = Query(None),
     agent_type_id: Optional[int] = Query(None),
     db: Session = Depends(get_db)
 ):
     """Get all agents with pagination and filtering"""
-    query = db.query(AgentModel).options(joinedload(AgentModel.agent_type))
+    # agent_type_name is denormalized onto agents, so no join is needed here;
+    # raiseload("*") turns any accidental per-row lazy load into an error instead of an N+1
+    query = db.query(AgentModel).options(raiseload("*"))
     
     if status:
         query = query.filter(AgentModel.status == status)
     if agent_type_id:
         query = query.filter(AgentModel.agent_type_id == agent_type_id)
     
-    agents = query.offset(skip).limit(limit).all()
-    total = query.count()
+    agents, total, has_next = paginate(query, AgentModel.id, skip, limit, after_id)
     
     # Convert SQLAlchemy models to Pydantic schemas
-    agent_schemas = [Agent.from_orm(agent) for agent in agents]
+    agent_schemas = [Agent.from_orm_trusted(agent) for agent in agents]
     
-    return PaginatedResponse(
+    return json_response(AgentPage.model_construct(
         items=agent_schemas,
         total=total,
         page=skip // limit + 1,
-        size=limit,
-        pages=(total + limit - 1) // limit
-    )
+        per_page=limit,
+        has_next=has_next,
+        has_prev=skip > 0 or after_id is not None,
+        next_cursor=agent_schemas[-1].id if has_next else None
+    ))
 
 
 @router.get("/{agent_id}", response_model=Agent)
 def get_agent(agent_id: int, db: Session = Depends(get_db)):
     """Get a specific agent by ID"""
-    agent = db.query(AgentModel).options(joinedload(AgentModel.agent_type)).filter(AgentModel.id == agent_id).first()
+    # lambda_stmt caches the built statement; only agent_id is re-bound per call
+    stmt = lambda_stmt(lambda: select(AgentModel))
+    stmt += lambda s: s.where(AgentModel.id == agent_id)
+    agent = db.execute(stmt).scalar_one_or_none()
     if not agent:
         raise HTTPException(status_code=404, detail="Agent not found")
-    return agent
+    return json_response(Agent.from_orm_trusted(agent))
 
 
 @router.put("/{agent_id}", response_model=Agent)
 def update_agent(agent_id: int, agent_update: AgentUpdate, db: Session = Depends(get_db)):
     """Update a specific agent"""
-    db_agent = db.query(AgentModel).filter(AgentModel.id == agent_id).first()
+    update_data = agent_update.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_agent(agent_id, db)
+    
+    # Bulk UPDATE bypasses ORM events, so refresh the denormalized type name
+    # here, read by a subquery in the same statement
+    if "agent_type_id" in update_data:
+        update_data["agent_type_name"] = agent_type_name_subquery(update_data["agent_type_id"])
+    
+    # Single UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+    db_agent = db.execute(
+        update(AgentModel)
+        .where(AgentModel.id == agent_id)
+        .values(**update_data)
+        .returning(AgentModel)
+    ).scalar_one_or_none()
     if not db_agent:
         raise HTTPException(status_code=404, detail="Agent not found")
+    if "agent_type_id" in update_data and db_agent.agent_type_name is None:
+        # The subquery found no such agent type
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Agent type not found")
     
-    update_data = agent_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_agent, field, value)
-    
+    agent_schema = Agent.from_orm_trusted(db_agent)
     db.commit()
-    db.refresh(db_agent)
-    return db_agent
+    return json_response(agent_schema)
 
 
 @router.delete("/{agent_id}")
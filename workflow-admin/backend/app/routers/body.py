@@ -0,0 +1,58 @@
+"""
+Request and response body handling shared by the routers
+"""
+
+from fastapi import Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, TypeAdapter, ValidationError
+from pydantic_core import to_json
+from typing import Any, Type
+
+from ..schemas import TrustedModel
+
+
+def json_body(adapter: TypeAdapter):
+    """
+    Dependency that validates the raw request body with pydantic-core's JSON parser,
+    instead of json.loads into Python objects followed by a second validation pass
+    """
+    async def parse(request: Request):
+        try:
+            return adapter.validate_json(await request.body())
+        except ValidationError as exc:
+            # Same 422 shape FastAPI produces for declared body parameters
+            raise RequestValidationError(
+                [{**error, "loc": ("body", *error["loc"])} for error in exc.errors(include_url=False)]
+            )
+    return parse
+
+
+def json_body_openapi(model: Type[BaseModel]) -> dict:
+    """
+    openapi_extra describing a body read by json_body, which FastAPI can't see;
+    the schema is inlined since nothing else may register it as a component
+    """
+    return {"requestBody": {"required": True, "content": {"application/json": {
+        "schema": model.model_json_schema()
+    }}}}
+
+
+def json_response(model: TrustedModel) -> Response:
+    """
+    Respond with a schema's own JSON bytes; returning a Response skips FastAPI's
+    response_model re-validation and jsonable_encoder walk
+    """
+    return Response(content=model.to_json(), media_type="application/json")
+
+
+class JSONResponse(ORJSONResponse):
+    """
+    Default response class: orjson, except for content it rejects (integers
+    wider than 64 bits), which pydantic-core encodes instead of a 500
+    """
+    def render(self, content: Any) -> bytes:
+        try:
+            return super().render(content)
+        except TypeError:
+            return to_json(content)
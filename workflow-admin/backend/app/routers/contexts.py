@@ -3,21 +3,32 @@ Organizational Context API endpoints
 Handles organizational knowledge, standards, and business context
 """
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+import base64
+import binascii
+import hashlib
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
+from sqlalchemy import JSON, Text, and_, cast, func, lambda_stmt, or_, select, update
+from sqlalchemy.dialects.postgresql import aggregate_order_by, insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.exc import IntegrityError
 from typing import List, Optional
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from ..database.database import get_db
+from ..cache import TTLCache
+from .body import json_response
+from ..database.database import get_async_db, get_db
 from ..database.models import OrganizationalContext
+from ..schemas import BoundedJson, TrustedModel
 
 router = APIRouter(
     prefix="/api/v1/contexts",
     tags=["Organizational Contexts"],
 )
 
-class OrganizationalContextResponse(BaseModel):
+class OrganizationalContextResponse(TrustedModel):
     id: int
     category: str
     name: str
@@ -27,64 +38,159 @@ class OrganizationalContextResponse(BaseModel):
     priority: int
     is_active: bool
 
-    class Config:
-        from_attributes = True
+# Dumps a whole page to JSON bytes in one pydantic-core pass
+_context_list = TypeAdapter(List[OrganizationalContextResponse])
+
+# The listing selects exactly the response fields, in declaration order
+_context_fields = tuple(OrganizationalContextResponse.model_fields)
+_context_field_set = set(_context_fields)
+_context_columns = [getattr(OrganizationalContext, name) for name in _context_fields]
 
 class CreateOrganizationalContextRequest(BaseModel):
     category: str
     name: str
     description: Optional[str] = None
-    content: dict
+    content: BoundedJson
     applies_to: Optional[List[str]] = None
     priority: int = 5
 
 class UpdateOrganizationalContextRequest(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
-    content: Optional[dict] = None
+    content: Optional[BoundedJson] = None
     applies_to: Optional[List[str]] = None
     priority: Optional[int] = None
     is_active: Optional[bool] = None
 
-@router.get("/categories", response_model=List[str])
-def get_context_categories(db: Session = Depends(get_db)):
-    """Get all available context categories"""
-    categories = db.query(OrganizationalContext.category).distinct().all()
-    return [category[0] for category in categories]
+# Contexts are read-mostly configuration consulted by every workflow step,
+# so list lookups are cached briefly and invalidated on any write
+_context_cache = TTLCache(maxsize=1024, ttl=60)
+# invalidate_context_caches() only reaches this process, so other workers
+# see a write once their entries expire; both caches share the 60s bound
+_category_cache = TTLCache(maxsize=1, ttl=60)
 
-@router.get("/", response_model=List[OrganizationalContextResponse])
-def get_organizational_contexts(
+
+def invalidate_context_caches():
+    """Drop cached context lookups after a write"""
+    _context_cache.invalidate()
+    _category_cache.invalidate()
+
+
+def encode_context_cursor(context: OrganizationalContextResponse) -> str:
+    """Opaque keyset cursor carrying the listing's sort key (priority, name, id)"""
+    return base64.urlsafe_b64encode(orjson.dumps([context.priority, context.name, context.id])).decode()
+
+
+def decode_context_cursor(cursor: str) -> tuple:
+    """(priority, name, id) from a cursor made by encode_context_cursor"""
+    try:
+        priority, name, context_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (binascii.Error, orjson.JSONDecodeError, TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not (isinstance(priority, int) and isinstance(name, str) and isinstance(context_id, int)):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return priority, name, context_id
+
+
+async def get_contexts(
+    db: AsyncSession,
     category: Optional[str] = None,
     scope: Optional[str] = None,
     active_only: bool = True,
     skip: int = 0,
     limit: int = 100,
-    db: Session = Depends(get_db)
-):
-    """Get organizational contexts with optional filtering"""
-    query = db.query(OrganizationalContext)
+    cursor: Optional[str] = None
+) -> tuple:
+    """
+    Load organizational contexts as (JSON array, next page cursor or None),
+    served from the in-process cache when fresh
+    """
+    key = (_context_cache.version, category, scope, active_only, skip, limit, cursor)
+    page = _context_cache.get(key)
+    if page is not None:
+        return page
+    
+    # lambda_stmt caches each filter combination's statement by shape;
+    # per request only the closure values are re-bound
+    stmt = lambda_stmt(lambda: select(*_context_columns))
     
     if active_only:
-        query = query.filter(OrganizationalContext.is_active == True)
+        stmt += lambda s: s.where(OrganizationalContext.is_active == True)
     
     if category:
-        query = query.filter(OrganizationalContext.category == category)
+        stmt += lambda s: s.where(OrganizationalContext.category == category)
     
     if scope:
-        query = query.filter(OrganizationalContext.scope == scope)
+        stmt += lambda s: s.where(OrganizationalContext.scope == scope)
+    
+    if cursor is not None:
+        # Keyset: seek past the cursor's (priority DESC, name, id) sort key
+        # instead of reading and discarding skip rows
+        cursor_priority, cursor_name, cursor_id = decode_context_cursor(cursor)
+        stmt += lambda s: s.where(or_(
+            OrganizationalContext.priority < cursor_priority,
+            and_(OrganizationalContext.priority == cursor_priority, OrganizationalContext.name > cursor_name),
+            and_(
+                OrganizationalContext.priority == cursor_priority,
+                OrganizationalContext.name == cursor_name,
+                OrganizationalContext.id > cursor_id
+            )
+        ))
+    else:
+        stmt += lambda s: s.offset(skip)
     
-    query = query.order_by(OrganizationalContext.priority.desc(), OrganizationalContext.name)
+    # One extra row tells whether a next page exists
+    stmt += lambda s: s.order_by(
+        OrganizationalContext.priority.desc(), OrganizationalContext.name, OrganizationalContext.id
+    ).limit(limit + 1)
     
-    contexts = query.offset(skip).limit(limit).all()
-    return contexts
+    # Plain column tuples: no ORM instances or identity-map entries to build per row
+    result = await db.execute(stmt)
+    contexts = [
+        OrganizationalContextResponse.model_construct(_fields_set=_context_field_set, **dict(zip(_context_fields, row)))
+        for row in result
+    ]
+    next_cursor = encode_context_cursor(contexts[limit - 1]) if limit and len(contexts) > limit else None
+    page = (_context_list.dump_json(contexts[:limit]), next_cursor)
+    _context_cache.set(key, page)
+    return page
+
+@router.get("/categories", response_model=List[str])
+async def get_context_categories(db: AsyncSession = Depends(get_async_db)):
+    """Get all available context categories"""
+    key = _category_cache.version
+    categories = _category_cache.get(key)
+    if categories is None:
+        categories = (await db.scalars(select(OrganizationalContext.category).distinct())).all()
+        _category_cache.set(key, categories)
+    return categories
+
+@router.get("/", response_model=List[OrganizationalContextResponse])
+async def get_organizational_contexts(
+    category: Optional[str] = None,
+    scope: Optional[str] = None,
+    active_only: bool = True,
+    skip: int = 0,
+    limit: int = 100,
+    cursor: Optional[str] = Query(None, description="Keyset cursor: the X-Next-Cursor header of the previous page"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Get organizational contexts with optional filtering. The body stays a
+    plain list; when more rows follow, the X-Next-Cursor header holds the
+    cursor for the next page
+    """
+    body, next_cursor = await get_contexts(db, category, scope, active_only, skip, limit, cursor)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else None
+    return Response(content=body, media_type="application/json", headers=headers)
 
 @router.get("/{context_id}", response_model=OrganizationalContextResponse)
-def get_organizational_context(context_id: int, db: Session = Depends(get_db)):
+async def get_organizational_context(context_id: int, db: AsyncSession = Depends(get_async_db)):
     """Get a specific organizational context by ID"""
-    context = db.query(OrganizationalContext).filter(OrganizationalContext.id == context_id).first()
+    context = await db.get(OrganizationalContext, context_id)
     if not context:
         raise HTTPException(status_code=404, detail="Context not found")
-    return context
+    return json_response(OrganizationalContextResponse.from_orm_trusted(context))
 
 @router.post("/", response_model=OrganizationalContextResponse)
 def create_organizational_context(
@@ -92,69 +198,117 @@ def create_organizational_context(
     db: Session = Depends(get_db)
 ):
     """Create a new organizational context"""
-    # Check for duplicate name within category
-    existing = db.query(OrganizationalContext).filter(
-        and_(
-            OrganizationalContext.category == context_data.category,
-            OrganizationalContext.name == context_data.name
+    # Duplicate check and insert in one statement: ON CONFLICT on the
+    # (category, name) unique constraint inserts nothing and returns no row
+    insert = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    db_context = db.execute(
+        insert(OrganizationalContext)
+        .values(
+            category=context_data.category,
+            name=context_data.name,
+            description=context_data.description,
+            content=context_data.content,
+            applies_to=context_data.applies_to or [],
+            priority=context_data.priority
         )
-    ).first()
+        .on_conflict_do_nothing(index_elements=["category", "name"])
+        .returning(OrganizationalContext)
+    ).scalar_one_or_none()
     
-    if existing:
+    if db_context is None:
         raise HTTPException(
             status_code=400, 
             detail=f"Context '{context_data.name}' already exists in category '{context_data.category}'"
         )
     
-    # Create new context
-    db_context = OrganizationalContext(
-        category=context_data.category,
-        name=context_data.name,
-        description=context_data.description,
-        content=context_data.content,
-        applies_to=context_data.applies_to or [],
-        priority=context_data.priority
-    )
-    
-    db.add(db_context)
+    context_response = OrganizationalContextResponse.from_orm_trusted(db_context)
     db.commit()
-    db.refresh(db_context)
+    invalidate_context_caches()
     
-    return db_context
+    return context_response
 
-@router.get("/selectable/project-contexts")
-def get_selectable_project_contexts(db: Session = Depends(get_db)):
-    """Get contexts suitable for project selection (Tech stack, Security, Compliance, Business guidelines)"""
-    suitable_categories = ['tech_standards', 'security', 'compliance', 'business_guidelines']
+# Categories offered when selecting contexts for a project
+SELECTABLE_CATEGORIES = ['tech_standards', 'security', 'compliance', 'business_guidelines']
+
+def selectable_contexts_statement(dialect_name: str, categories: List[str]):
+    """
+    Build a single-row SELECT of the whole {category: [context summaries]} document as JSON text,
+    so the response body is produced by the database and never decoded into Python objects
+    """
+    context = OrganizationalContext
+    filters = (context.category.in_(categories), context.is_active == True)
     
-    contexts = db.query(OrganizationalContext).filter(
-        and_(
-            OrganizationalContext.category.in_(suitable_categories),
-            OrganizationalContext.is_active == True
+    if dialect_name == "postgresql":
+        item = func.json_build_object(
+            'id', context.id,
+            'name', context.name,
+            'description', context.description,
+            'category', context.category,
+            'content_summary', func.coalesce(context.content['summary'].as_string(), ''),
+            'tags', func.coalesce(context.content['tags'], cast('[]', JSON))
         )
-    ).order_by(
-        OrganizationalContext.category,
-        OrganizationalContext.priority.desc(),
-        OrganizationalContext.name
-    ).all()
-    
-    # Group by category for easier UI consumption
-    grouped_contexts = {}
-    for context in contexts:
-        category = context.category
-        if category not in grouped_contexts:
-            grouped_contexts[category] = []
+        items = func.json_agg(aggregate_order_by(item, context.priority.desc(), context.name), type_=JSON)
+        grouped = select(context.category, items.label("contexts")).where(*filters).group_by(context.category).subquery()
+        document = func.json_object_agg(grouped.c.category, grouped.c.contexts)
+        # Cast to text so the driver hands back the JSON string instead of decoding it
+        return select(func.coalesce(cast(document, Text), '{}'))
+    
+    # SQLite has no ORDER BY inside aggregates; aggregate over an ordered subquery instead
+    ordered = select(
+        context.category, context.id, context.name, context.description, context.content
+    ).where(*filters).order_by(context.category, context.priority.desc(), context.name).subquery()
+    item = func.json_object(
+        'id', ordered.c.id,
+        'name', ordered.c.name,
+        'description', ordered.c.description,
+        'category', ordered.c.category,
+        'content_summary', func.coalesce(func.json_extract(ordered.c.content, '$.summary'), ''),
+        'tags', func.json(func.coalesce(func.json_extract(ordered.c.content, '$.tags'), '[]'))
+    )
+    grouped = select(
+        ordered.c.category, func.json_group_array(item).label("contexts")
+    ).group_by(ordered.c.category).order_by(ordered.c.category).subquery()
+    # json() re-marks the subquery's text as JSON so it is embedded, not quoted
+    return select(func.json_group_object(grouped.c.category, func.json(grouped.c.contexts)))
+
+async def _selectable_contexts_etag(db: AsyncSession, categories: List[str]) -> str:
+    """Weak ETag from max(updated_at) and row count; inactive rows count too so deactivation changes it"""
+    last_updated, row_count = (await db.execute(
+        select(func.max(OrganizationalContext.updated_at), func.count())
+        .where(OrganizationalContext.category.in_(categories))
+    )).one()
+    digest = hashlib.sha1(f"{last_updated}:{row_count}".encode()).hexdigest()
+    return f'W/"{digest}"'
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Check an If-None-Match header, which may list several tags"""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (tag.strip() for tag in if_none_match.split(","))
+
+@router.get("/selectable/project-contexts")
+async def get_selectable_project_contexts(request: Request, db: AsyncSession = Depends(get_async_db)):
+    """Get contexts suitable for project selection (Tech stack, Security, Compliance, Business guidelines)"""
+    key = (_context_cache.version, "selectable")
+    cached = _context_cache.get(key)
+    if cached is None:
+        # Revalidating clients get a 304 from the cheap aggregate alone,
+        # before the grouped listing is built or serialized
+        etag = await _selectable_contexts_etag(db, SELECTABLE_CATEGORIES)
+        if _etag_matches(request, etag):
+            return Response(status_code=304, headers={"ETag": etag})
         
-        grouped_contexts[category].append({
-            'id': context.id,
-            'name': context.name,
-            'description': context.description,
-            'category': category,
-            'content_summary': context.content.get('summary', ''),
-            'tags': context.tags or []
-        })
+        # Grouped by category for easier UI consumption; the database renders the
+        # whole document, which is passed through as the body without re-encoding
+        document = await db.scalar(selectable_contexts_statement(db.bind.dialect.name, SELECTABLE_CATEGORIES))
+        cached = (etag, document.encode())
+        _context_cache.set(key, cached)
     
-    return grouped_contexts
+    etag, body = cached
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
 
 @router.put("/{context_id}", response_model=OrganizationalContextResponse)
 def update_organizational_context(
@@ -163,28 +317,35 @@ def update_organizational_context(
     db: Session = Depends(get_db)
 ):
     """Update an organizational context"""
-    context = db.query(OrganizationalContext).filter(OrganizationalContext.id == context_id).first()
+    # Update fields that were provided
+    update_data = context_data.model_dump(exclude_none=True)
+    if update_data:
+        # Single UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+        try:
+            context = db.execute(
+                update(OrganizationalContext)
+                .where(OrganizationalContext.id == context_id)
+                .values(**update_data)
+                .returning(OrganizationalContext)
+            ).scalar_one_or_none()
+        except IntegrityError:
+            # A rename onto a name already used in this context's category
+            db.rollback()
+            existing = db.get(OrganizationalContext, context_id)
+            raise HTTPException(
+                status_code=400,
+                detail=f"Context '{context_data.name}' already exists in category '{existing.category}'"
+            )
+    else:
+        context = db.get(OrganizationalContext, context_id)
     if not context:
         raise HTTPException(status_code=404, detail="Context not found")
     
-    # Update fields that were provided
-    if context_data.name is not None:
-        context.name = context_data.name
-    if context_data.description is not None:
-        context.description = context_data.description
-    if context_data.content is not None:
-        context.content = context_data.content
-    if context_data.applies_to is not None:
-        context.applies_to = context_data.applies_to
-    if context_data.priority is not None:
-        context.priority = context_data.priority
-    if context_data.is_active is not None:
-        context.is_active = context_data.is_active
-    
+    context_response = OrganizationalContextResponse.from_orm_trusted(context)
     db.commit()
-    db.refresh(context)
+    invalidate_context_caches()
     
-    return context
+    return context_response
 
 @router.delete("/{context_id}")
 def delete_organizational_context(
@@ -198,5 +359,6 @@ def delete_organizational_context(
     
     db.delete(context)
     db.commit()
+    invalidate_context_caches()
     
     return {"message": "Context deleted successfully"}
\ No newline at end of file
@@ -0,0 +1,29 @@
+"""
+Shared pagination helpers for list endpoints
+"""
+
+from sqlalchemy import func
+from typing import Optional
+
+
+def paginate(query, id_column, skip: int, limit: int, after_id: Optional[int] = None):
+    """
+    Fetch one page ordered by id, returning (items, total, has_next).
+    With after_id the page is found by seeking past the cursor on the
+    primary key (keyset) instead of reading and discarding skip rows.
+    Keyset pages return total=None: counting would rescan the whole filtered
+    set on every page, and clients already have it from the first page.
+    """
+    if after_id is not None:
+        total = None
+        items = query.filter(id_column > after_id).order_by(id_column).limit(limit + 1).all()
+    else:
+        # Window count returns the filtered total alongside the page in one round-trip
+        rows = query.add_columns(func.count().over().label("total")).order_by(id_column).offset(skip).limit(limit + 1).all()
+        if rows:
+            total = rows[0].total
+        else:
+            # Page past the end carries no window count; fall back to a plain count
+            total = query.with_entities(func.count(id_column)).scalar() if skip else 0
+        items = [item for item, _ in rows]
+    return items[:limit], total, len(items) > limit
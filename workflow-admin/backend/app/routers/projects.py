@@ -2,21 +2,33 @@
 Project management endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+import json
+from pydantic import TypeAdapter
+from pydantic_core import to_json
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, raiseload, selectinload
 from typing import List, Optional
 
-from ..database.database import get_db
-from ..database.models import Project as ProjectModel
-from ..schemas import Project, ProjectCreate, ProjectUpdate, PaginatedResponse
+from .body import json_response
+from ..database.database import get_async_db, get_db
+from ..database.models import Project as ProjectModel, Team as TeamModel, Workflow as WorkflowModel
+from .contexts import SELECTABLE_CATEGORIES, selectable_contexts_statement
+from ..schemas import Project, ProjectCreate, ProjectUpdate, Team, Workflow, PaginatedResponse
 
 router = APIRouter(prefix="/api/v1/projects", tags=["projects"])
 
+_project_list = TypeAdapter(List[Project])
+
+# Prebuilt by-id lookup; handlers only bind the id, skipping per-request statement construction
+_get_project_stmt = select(ProjectModel).where(ProjectModel.id == bindparam("id"))
+
 
 @router.post("/", response_model=Project)
 def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
     """Create a new project"""
-    project_data = project.dict()
+    project_data = project.model_dump()
     
     # Move selected_contexts to settings if provided
     selected_contexts = project_data.pop('selected_contexts', [])
@@ -31,7 +43,7 @@ def create_project(project: ProjectCreate, db: Session = Depends(get_db)):
     db.add(db_project)
     db.commit()
     db.refresh(db_project)
-    return db_project
+    return json_response(Project.from_orm_trusted(db_project))
 
 
 @router.get("/", response_model=List[Project])
@@ -41,39 +53,86 @@ def get_projects(
     db: Session = Depends(get_db)
 ):
     """Get all projects with pagination"""
-    projects = db.query(ProjectModel).offset(skip).limit(limit).all()
-    return [Project.from_orm(project) for project in projects]
+    # raiseload("*") turns any accidental per-row lazy load into an error instead of an N+1
+    projects = db.query(ProjectModel).options(raiseload("*")).offset(skip).limit(limit).all()
+    # Returning a Response skips response_model re-validation and jsonable_encoder
+    return Response(
+        content=_project_list.dump_json([Project.from_orm_trusted(project) for project in projects]),
+        media_type="application/json"
+    )
 
 
 @router.get("/{project_id}", response_model=Project)
 def get_project(project_id: int, db: Session = Depends(get_db)):
     """Get a specific project by ID"""
-    project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
+    project = db.execute(_get_project_stmt, {"id": project_id}).scalar_one_or_none()
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
-    return project
+    return json_response(Project.from_orm_trusted(project))
+
+
+@router.get("/{project_id}/dashboard")
+async def get_project_dashboard(project_id: int, db: AsyncSession = Depends(get_async_db)):
+    """Get a project with its active teams, its workflows and the selectable contexts in one response"""
+    # The queries run back to back on the request's one session: a session
+    # per query would hold four pooled connections for every dashboard view
+    project = await db.scalar(select(ProjectModel).options(raiseload("*")).where(ProjectModel.id == project_id))
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    teams = (await db.scalars(
+        select(TeamModel).options(raiseload("*"))
+        .where(TeamModel.project_id == project_id, TeamModel.is_active == True)
+    )).all()
+    workflows = (await db.scalars(
+        select(WorkflowModel).options(raiseload("*"))
+        .where(WorkflowModel.project_id == project_id).order_by(WorkflowModel.id)
+    )).all()
+    document = await db.scalar(selectable_contexts_statement(db.bind.dialect.name, SELECTABLE_CATEGORIES))
+    
+    # Stdlib decode and pydantic-core encode keep integers wider than 64 bits
+    # exact, which orjson would turn into floats or reject
+    return Response(content=to_json({
+        "project": Project.from_orm_trusted(project),
+        "teams": [Team.from_orm_trusted(team) for team in teams],
+        "workflows": [Workflow.from_orm_trusted(workflow) for workflow in workflows],
+        "selectable_contexts": json.loads(document)
+    }), media_type="application/json")
 
 
 @router.put("/{project_id}", response_model=Project)
 def update_project(project_id: int, project_update: ProjectUpdate, db: Session = Depends(get_db)):
     """Update a specific project"""
-    db_project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
+    update_data = project_update.model_dump(exclude_unset=True)
+    if update_data:
+        # Single UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+        db_project = db.execute(
+            update(ProjectModel)
+            .where(ProjectModel.id == project_id)
+            .values(**update_data)
+            .returning(ProjectModel)
+        ).scalar_one_or_none()
+    else:
+        db_project = db.get(ProjectModel, project_id)
     if not db_project:
         raise HTTPException(status_code=404, detail="Project not found")
     
-    update_data = project_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_project, field, value)
-    
+    project_schema = Project.from_orm_trusted(db_project)
     db.commit()
-    db.refresh(db_project)
-    return db_project
+    return json_response(project_schema)
 
 
 @router.delete("/{project_id}")
 def delete_project(project_id: int, db: Session = Depends(get_db)):
     """Delete a specific project"""
-    db_project = db.query(ProjectModel).filter(ProjectModel.id == project_id).first()
+    # Batch-load workflow child collections for the delete cascade instead of one SELECT per workflow each
+    workflows = selectinload(ProjectModel.workflows)
+    db_project = db.query(ProjectModel).options(
+        workflows.selectinload(WorkflowModel.nodes),
+        workflows.selectinload(WorkflowModel.edges),
+        workflows.selectinload(WorkflowModel.steps),
+        workflows.selectinload(WorkflowModel.runs),
+        workflows.selectinload(WorkflowModel.assignments)
+    ).filter(ProjectModel.id == project_id).first()
     if not db_project:
         raise HTTPException(status_code=404, detail="Project not found")
     
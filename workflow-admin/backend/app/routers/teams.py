@@ -2,49 +2,69 @@
 Team management endpoints
 """
 
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, insert, select, update
+from sqlalchemy.orm import Session, raiseload
 from typing import List, Optional
 
+from .body import json_response
 from ..database.database import get_db
-from ..database.models import Team as TeamModel, TeamMember
+from ..database.models import Agent as AgentModel, Team as TeamModel, TeamMember
 from ..schemas import Team, TeamCreate, TeamUpdate, PaginatedResponse
 
 router = APIRouter(prefix="/api/v1/teams", tags=["teams"])
 
+_team_list = TypeAdapter(List[Team])
+_get_team_stmt = select(TeamModel).where(TeamModel.id == bindparam("id"))
+
+
+def _verify_agents_exist(db: Session, agent_ids: List[int]):
+    """Verify all member agents exist with a single IN query"""
+    known_ids = set(db.scalars(select(AgentModel.id).where(AgentModel.id.in_(agent_ids))))
+    missing_ids = set(agent_ids) - known_ids
+    if missing_ids:
+        raise HTTPException(status_code=400, detail=f"Agent not found: {sorted(missing_ids)}")
+
+
+def _member_rows(team_id: int, agent_ids: List[int], team_lead_id: Optional[int]) -> List[dict]:
+    """Build TeamMember rows, with role "lead" for the team lead's membership"""
+    return [
+        {
+            "team_id": team_id,
+            "agent_id": agent_id,
+            "role": "lead" if agent_id == team_lead_id else "member",
+            "is_active": True
+        }
+        for agent_id in agent_ids
+    ]
+
 
 @router.post("/", response_model=Team)
 def create_team(team: TeamCreate, db: Session = Depends(get_db)):
-    """Create a new team"""
-    team_data = team.dict()
+    """Create a new team; unknown member_agent_ids are a 400"""
+    team_data = team.model_dump()
     
     # Extract member_agent_ids before creating the team
     member_agent_ids = team_data.pop('member_agent_ids', [])
+    if member_agent_ids:
+        _verify_agents_exist(db, member_agent_ids)
     
-    # Create the team
+    # Create the team; flush assigns the id without a commit and re-SELECT
     db_team = TeamModel(**team_data)
     db.add(db_team)
-    db.commit()
-    db.refresh(db_team)
+    db.flush()
     
     # Add team members if provided
     if member_agent_ids:
-        for agent_id in member_agent_ids:
-            # Determine role based on whether this is the team lead
-            role = "lead" if agent_id == team.team_lead_id else "member"
-            
-            team_member = TeamMember(
-                team_id=db_team.id,
-                agent_id=agent_id,
-                role=role,
-                is_active=True
-            )
-            db.add(team_member)
-        
-        db.commit()
-        db.refresh(db_team)
+        # One multi-row INSERT for all members
+        db.execute(insert(TeamMember), _member_rows(db_team.id, member_agent_ids, team.team_lead_id))
     
-    return db_team
+    # Column defaults are client-side, so the flushed instance is complete;
+    # serialize before commit expires it, then commit team and members together
+    response = Team.from_orm_trusted(db_team)
+    db.commit()
+    return json_response(response)
 
 
 @router.get("/", response_model=List[Team])
@@ -56,7 +76,8 @@ def get_teams(
     db: Session = Depends(get_db)
 ):
     """Get all teams with pagination and filtering"""
-    query = db.query(TeamModel)
+    # raiseload("*") turns any accidental per-row lazy load into an error instead of an N+1
+    query = db.query(TeamModel).options(raiseload("*"))
     
     if active_only:
         query = query.filter(TeamModel.is_active == True)
@@ -64,55 +85,57 @@ def get_teams(
         query = query.filter(TeamModel.project_id == project_id)
     
     teams = query.offset(skip).limit(limit).all()
-    return [Team.from_orm(team) for team in teams]
+    # One pydantic-core pass dumps the page; returning a Response skips response_model re-validation
+    return Response(
+        content=_team_list.dump_json([Team.from_orm_trusted(team) for team in teams]),
+        media_type="application/json"
+    )
 
 
 @router.get("/{team_id}", response_model=Team)
 def get_team(team_id: int, db: Session = Depends(get_db)):
     """Get a specific team by ID"""
-    team = db.query(TeamModel).filter(TeamModel.id == team_id).first()
+    team = db.execute(_get_team_stmt, {"id": team_id}).scalar_one_or_none()
     if not team:
         raise HTTPException(status_code=404, detail="Team not found")
-    return team
+    return json_response(Team.from_orm_trusted(team))
 
 
 @router.put("/{team_id}", response_model=Team)
 def update_team(team_id: int, team_update: TeamUpdate, db: Session = Depends(get_db)):
-    """Update a specific team"""
-    db_team = db.query(TeamModel).filter(TeamModel.id == team_id).first()
-    if not db_team:
-        raise HTTPException(status_code=404, detail="Team not found")
-    
-    update_data = team_update.dict(exclude_unset=True)
+    """Update a specific team; unknown member_agent_ids are a 400"""
+    update_data = team_update.model_dump(exclude_unset=True)
     
     # Extract member_agent_ids before updating the team
     member_agent_ids = update_data.pop('member_agent_ids', None)
+    if member_agent_ids:
+        _verify_agents_exist(db, member_agent_ids)
     
-    # Update team basic fields
-    for field, value in update_data.items():
-        setattr(db_team, field, value)
+    # Update team basic fields with a single UPDATE ... RETURNING
+    if update_data:
+        db_team = db.execute(
+            update(TeamModel)
+            .where(TeamModel.id == team_id)
+            .values(**update_data)
+            .returning(TeamModel)
+        ).scalar_one_or_none()
+    else:
+        db_team = db.get(TeamModel, team_id)
+    if not db_team:
+        raise HTTPException(status_code=404, detail="Team not found")
     
     # Handle team member updates if provided
     if member_agent_ids is not None:
         # Remove existing team members
         db.query(TeamMember).filter(TeamMember.team_id == team_id).delete()
         
-        # Add new team members
-        for agent_id in member_agent_ids:
-            # Determine role based on whether this is the team lead
-            role = "lead" if agent_id == team_update.team_lead_id else "member"
-            
-            team_member = TeamMember(
-                team_id=team_id,
-                agent_id=agent_id,
-                role=role,
-                is_active=True
-            )
-            db.add(team_member)
+        # Add new team members with one multi-row INSERT
+        if member_agent_ids:
+            db.execute(insert(TeamMember), _member_rows(team_id, member_agent_ids, team_update.team_lead_id))
     
+    team_schema = Team.from_orm_trusted(db_team)
     db.commit()
-    db.refresh(db_team)
-    return db_team
+    return json_response(team_schema)
 
 
 @router.delete("/{team_id}")
@@ -3,41 +3,61 @@ Workflow management endpoints
 """
 
 from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
+from pydantic import TypeAdapter
+from sqlalchemy import bindparam, select, update
+from sqlalchemy.orm import Session, raiseload, selectinload
 from typing import List, Optional
 
+from .body import json_body, json_body_openapi, json_response
 from ..database.database import get_db
 from ..database.models import Workflow as WorkflowModel, WorkflowAssignment as WorkflowAssignmentModel
+from .pagination import paginate
 from ..schemas import (
     Workflow, WorkflowCreate, WorkflowUpdate, 
     WorkflowAssignment, WorkflowAssignmentCreate, WorkflowAssignmentUpdate,
-    PaginatedResponse
+    WorkflowPage, WorkflowAssignmentPage
 )
 
 router = APIRouter(prefix="/api/v1/workflows", tags=["workflows"])
 
+# Workflow bodies carry the full definition graph, so they are parsed straight
+# from bytes by pydantic-core rather than json.loads followed by validation
+_workflow_create = TypeAdapter(WorkflowCreate)
+_workflow_update = TypeAdapter(WorkflowUpdate)
+
+_get_workflow_stmt = select(WorkflowModel).where(WorkflowModel.id == bindparam("id"))
+
 # Workflow endpoints
-@router.post("/", response_model=Workflow)
-def create_workflow(workflow: WorkflowCreate, db: Session = Depends(get_db)):
+@router.post(
+    "/",
+    response_model=Workflow,
+    openapi_extra=json_body_openapi(WorkflowCreate)
+)
+def create_workflow(
+    workflow: WorkflowCreate = Depends(json_body(_workflow_create)),
+    db: Session = Depends(get_db)
+):
     """Create a new workflow"""
-    db_workflow = WorkflowModel(**workflow.dict())
+    db_workflow = WorkflowModel(**workflow.model_dump())
     db.add(db_workflow)
     db.commit()
     db.refresh(db_workflow)
-    return db_workflow
+    return json_response(Workflow.from_orm_trusted(db_workflow))
 
 
-@router.get("/", response_model=PaginatedResponse)
+@router.get("/", response_model=WorkflowPage)
 def get_workflows(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     project_id: Optional[int] = Query(None),
     status: Optional[str] = Query(None),
     assigned_team_id: Optional[int] = Query(None),
+    after_id: Optional[int] = Query(None, description="Keyset cursor: return items with id greater than this"),
     db: Session = Depends(get_db)
 ):
     """Get all workflows with pagination and filtering"""
-    query = db.query(WorkflowModel)
+    # raiseload("*") turns any accidental per-row lazy load into an error instead of an N+1
+    query = db.query(WorkflowModel).options(raiseload("*"))
     
     if project_id:
         query = query.filter(WorkflowModel.project_id == project_id)
@@ -46,47 +66,70 @@ def get_workflows(
     if assigned_team_id:
         query = query.filter(WorkflowModel.assigned_team_id == assigned_team_id)
     
-    workflows = query.offset(skip).limit(limit).all()
-    total = query.count()
+    # Window count: page and filtered total in one query instead of .all() plus .count()
+    workflows, total, has_next = paginate(query, WorkflowModel.id, skip, limit, after_id)
     
-    return PaginatedResponse(
-        items=workflows,
+    return json_response(WorkflowPage.model_construct(
+        items=[Workflow.from_orm_trusted(item) for item in workflows],
         total=total,
         page=skip // limit + 1,
-        size=limit,
-        pages=(total + limit - 1) // limit
-    )
+        per_page=limit,
+        has_next=has_next,
+        has_prev=skip > 0 or after_id is not None,
+        next_cursor=workflows[-1].id if has_next else None
+    ))
 
 
 @router.get("/{workflow_id}", response_model=Workflow)
 def get_workflow(workflow_id: int, db: Session = Depends(get_db)):
     """Get a specific workflow by ID"""
-    workflow = db.query(WorkflowModel).filter(WorkflowModel.id == workflow_id).first()
+    workflow = db.execute(_get_workflow_stmt, {"id": workflow_id}).scalar_one_or_none()
     if not workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
-    return workflow
+    return json_response(Workflow.from_orm_trusted(workflow))
 
 
-@router.put("/{workflow_id}", response_model=Workflow)
-def update_workflow(workflow_id: int, workflow_update: WorkflowUpdate, db: Session = Depends(get_db)):
+@router.put(
+    "/{workflow_id}",
+    response_model=Workflow,
+    openapi_extra=json_body_openapi(WorkflowUpdate)
+)
+def update_workflow(
+    workflow_id: int,
+    workflow_update: WorkflowUpdate = Depends(json_body(_workflow_update)),
+    db: Session = Depends(get_db)
+):
     """Update a specific workflow"""
-    db_workflow = db.query(WorkflowModel).filter(WorkflowModel.id == workflow_id).first()
+    update_data = workflow_update.model_dump(exclude_unset=True)
+    if update_data:
+        # Single UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+        db_workflow = db.execute(
+            update(WorkflowModel)
+            .where(WorkflowModel.id == workflow_id)
+            .values(**update_data)
+            .returning(WorkflowModel)
+        ).scalar_one_or_none()
+    else:
+        db_workflow = db.get(WorkflowModel, workflow_id)
     if not db_workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
     
-    update_data = workflow_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_workflow, field, value)
-    
+    workflow_schema = Workflow.from_orm_trusted(db_workflow)
     db.commit()
-    db.refresh(db_workflow)
-    return db_workflow
+    return json_response(workflow_schema)
 
 
 @router.delete("/{workflow_id}")
 def delete_workflow(workflow_id: int, db: Session = Depends(get_db)):
     """Delete a specific workflow"""
-    db_workflow = db.query(WorkflowModel).filter(WorkflowModel.id == workflow_id).first()
+    # Batch-load child collections for the delete cascade instead of one SELECT each
+    db_workflow = db.query(WorkflowModel).options(
+        selectinload(WorkflowModel.nodes),
+        selectinload(WorkflowModel.edges),
+        selectinload(WorkflowModel.steps),
+        selectinload(WorkflowModel.runs),
+        selectinload(WorkflowModel.assignments)
+    ).filter(WorkflowModel.id == workflow_id).first()
     if not db_workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
     
@@ -108,17 +151,17 @@ def create_workflow_assignment(
     if not workflow:
         raise HTTPException(status_code=404, detail="Workflow not found")
     
-    assignment_data = assignment.dict()
+    assignment_data = assignment.model_dump()
     assignment_data["workflow_id"] = workflow_id
     
     db_assignment = WorkflowAssignmentModel(**assignment_data)
     db.add(db_assignment)
     db.commit()
     db.refresh(db_assignment)
-    return db_assignment
+    return json_response(WorkflowAssignment.from_orm_trusted(db_assignment))
 
 
-@router.get("/{workflow_id}/assignments", response_model=PaginatedResponse)
+@router.get("/{workflow_id}/assignments", response_model=WorkflowAssignmentPage)
 def get_workflow_assignments(
     workflow_id: int,
     skip: int = Query(0, ge=0),
@@ -132,16 +175,17 @@ def get_workflow_assignments(
     if status:
         query = query.filter(WorkflowAssignmentModel.status == status)
     
-    assignments = query.offset(skip).limit(limit).all()
-    total = query.count()
+    # Window count: page and filtered total in one query instead of .all() plus .count()
+    assignments, total, has_next = paginate(query, WorkflowAssignmentModel.id, skip, limit)
     
-    return PaginatedResponse(
-        items=assignments,
+    return json_response(WorkflowAssignmentPage.model_construct(
+        items=[WorkflowAssignment.from_orm_trusted(item) for item in assignments],
         total=total,
         page=skip // limit + 1,
-        size=limit,
-        pages=(total + limit - 1) // limit
-    )
+        per_page=limit,
+        has_next=has_next,
+        has_prev=skip > 0
+    ))
 
 
 @router.put("/assignments/{assignment_id}", response_model=WorkflowAssignment)
@@ -151,17 +195,23 @@ def update_workflow_assignment(
     db: Session = Depends(get_db)
 ):
     """Update a workflow assignment"""
-    db_assignment = db.query(WorkflowAssignmentModel).filter(WorkflowAssignmentModel.id == assignment_id).first()
+    update_data = assignment_update.model_dump(exclude_unset=True)
+    if update_data:
+        # Single UPDATE ... RETURNING instead of SELECT, UPDATE and refresh
+        db_assignment = db.execute(
+            update(WorkflowAssignmentModel)
+            .where(WorkflowAssignmentModel.id == assignment_id)
+            .values(**update_data)
+            .returning(WorkflowAssignmentModel)
+        ).scalar_one_or_none()
+    else:
+        db_assignment = db.get(WorkflowAssignmentModel, assignment_id)
     if not db_assignment:
         raise HTTPException(status_code=404, detail="Assignment not found")
     
-    update_data = assignment_update.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(db_assignment, field, value)
-    
+    assignment_schema = WorkflowAssignment.from_orm_trusted(db_assignment)
     db.commit()
-    db.refresh(db_assignment)
-    return db_assignment
+    return json_response(assignment_schema)
 
 
 @router.delete("/assignments/{assignment_id}")
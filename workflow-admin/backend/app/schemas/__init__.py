@@ -1,27 +1,49 @@
 """
 Schemas package
 Exports all schemas from their respective modules
+
+Validate raw JSON bytes with Model.model_validate_json (or routers.body.json_body)
+rather than Model(**json.loads(raw)), which parses the payload twice
 """
 
-from .base import TimestampMixin, PaginatedResponse, ErrorResponse
+import importlib
+
+from .base import BoundedJson, TrustedModel, TimestampMixin, PaginatedResponse, ErrorResponse
 from .project import ProjectBase, ProjectCreate, ProjectUpdate, Project
 from .team import TeamBase, TeamCreate, TeamUpdate, Team
 from .agent import (
     AgentTypeBase, AgentTypeCreate, AgentTypeUpdate, AgentType,
     AgentStatus, AgentBase, AgentCreate, AgentUpdate, Agent,
-    AgentContextBase, AgentContextCreate, AgentContextUpdate, AgentContext
+    AgentTypePage, AgentPage
 )
 from .workflow import (
     WorkflowStatus, WorkflowBase, WorkflowCreate, WorkflowUpdate, Workflow,
     AssignmentStatus, AssignmentType, Priority, 
     WorkflowAssignmentBase, WorkflowAssignmentCreate, WorkflowAssignmentUpdate, WorkflowAssignment,
-    StepType, WorkflowStepBase, WorkflowStepCreate, WorkflowStepUpdate, WorkflowStep
+    WorkflowPage, WorkflowAssignmentPage
 )
 
+# No router uses these yet; their modules are imported on first access
+# so building their core schemas doesn't add to startup time
+_LAZY_SCHEMAS = {
+    'AgentContextBase': '.agent_context', 'AgentContextCreate': '.agent_context',
+    'AgentContextUpdate': '.agent_context', 'AgentContext': '.agent_context',
+    'StepType': '.workflow_step', 'WorkflowStepBase': '.workflow_step',
+    'WorkflowStepCreate': '.workflow_step', 'WorkflowStepUpdate': '.workflow_step',
+    'WorkflowStep': '.workflow_step',
+}
+
+
+def __getattr__(name):
+    module = _LAZY_SCHEMAS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module, __name__), name)
+
 # Export all schemas for easier importing
 __all__ = [
     # Base
-    'TimestampMixin', 'PaginatedResponse', 'ErrorResponse',
+    'BoundedJson', 'TrustedModel', 'TimestampMixin', 'PaginatedResponse', 'ErrorResponse',
     
     # Project
     'ProjectBase', 'ProjectCreate', 'ProjectUpdate', 'Project',
@@ -32,11 +54,13 @@ __all__ = [
     # Agent
     'AgentTypeBase', 'AgentTypeCreate', 'AgentTypeUpdate', 'AgentType',
     'AgentStatus', 'AgentBase', 'AgentCreate', 'AgentUpdate', 'Agent',
+    'AgentTypePage', 'AgentPage',
     'AgentContextBase', 'AgentContextCreate', 'AgentContextUpdate', 'AgentContext',
     
     # Workflow
     'WorkflowStatus', 'WorkflowBase', 'WorkflowCreate', 'WorkflowUpdate', 'Workflow',
     'AssignmentStatus', 'AssignmentType', 'Priority',
     'WorkflowAssignmentBase', 'WorkflowAssignmentCreate', 'WorkflowAssignmentUpdate', 'WorkflowAssignment',
+    'WorkflowPage', 'WorkflowAssignmentPage',
     'StepType', 'WorkflowStepBase', 'WorkflowStepCreate', 'WorkflowStepUpdate', 'WorkflowStep'
 ]
\ No newline at end of file
@@ -3,19 +3,18 @@ Agent-related schemas
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from typing import Optional, Literal
 from datetime import datetime
-from enum import Enum
-from .base import TimestampMixin
+from .base import PaginatedResponse, TimestampMixin
 
 
 # Agent Type schemas
 class AgentTypeBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=100)
     description: Optional[str] = None
-    capabilities: Dict[str, Any] = Field(..., description="Skills, tools, integrations")
-    workflow_preferences: Optional[Dict[str, Any]] = None
-    default_config: Optional[Dict[str, Any]] = None
+    capabilities: dict = Field(..., description="Skills, tools, integrations")
+    workflow_preferences: Optional[dict] = None
+    default_config: Optional[dict] = None
 
 
 class AgentTypeCreate(AgentTypeBase):
@@ -25,85 +24,54 @@ class AgentTypeCreate(AgentTypeBase):
 class AgentTypeUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=100)
     description: Optional[str] = None
-    capabilities: Optional[Dict[str, Any]] = None
-    workflow_preferences: Optional[Dict[str, Any]] = None
-    default_config: Optional[Dict[str, Any]] = None
+    capabilities: Optional[dict] = None
+    workflow_preferences: Optional[dict] = None
+    default_config: Optional[dict] = None
 
 
 class AgentType(AgentTypeBase, TimestampMixin):
     id: int
     is_active: bool = True
 
-    class Config:
-        from_attributes = True
-
 
 # Agent schemas
-class AgentStatus(str, Enum):
-    active = "active"
-    inactive = "inactive"
-    maintenance = "maintenance"
-    error = "error"
+AgentStatus = Literal["active", "inactive", "maintenance", "error"]
 
 
 class AgentBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
     agent_type_id: int
     description: Optional[str] = None
-    configuration: Optional[Dict[str, Any]] = None
-    status: AgentStatus = AgentStatus.active
+    configuration: Optional[dict] = None
+    status: AgentStatus = "active"
     workload_capacity: int = Field(100, ge=1, le=1000)
     current_workload: int = Field(0, ge=0)
-    specializations: Optional[Dict[str, Any]] = None
+    specializations: Optional[dict] = None
 
 
 class AgentCreate(AgentBase):
-    credentials: Optional[Dict[str, Any]] = None
+    credentials: Optional[dict] = None
 
 
 class AgentUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     agent_type_id: Optional[int] = None
     description: Optional[str] = None
-    configuration: Optional[Dict[str, Any]] = None
-    credentials: Optional[Dict[str, Any]] = None
+    configuration: Optional[dict] = None
+    credentials: Optional[dict] = None
     status: Optional[AgentStatus] = None
     workload_capacity: Optional[int] = Field(None, ge=1, le=1000)
     current_workload: Optional[int] = Field(None, ge=0)
-    specializations: Optional[Dict[str, Any]] = None
+    specializations: Optional[dict] = None
 
 
 class Agent(AgentBase, TimestampMixin):
     id: int
-    performance_metrics: Optional[Dict[str, Any]] = None
+    agent_type_name: Optional[str] = None
+    performance_metrics: Optional[dict] = None
     last_active: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
-
-
-# Agent Context schemas
-class AgentContextBase(BaseModel):
-    agent_id: int
-    context_name: str = Field(..., min_length=1, max_length=255)
-    context_data: Dict[str, Any]
-    is_active: bool = True
-    priority: int = Field(0, description="Higher numbers = higher priority")
-
-
-class AgentContextCreate(AgentContextBase):
-    pass
-
-
-class AgentContextUpdate(BaseModel):
-    context_name: Optional[str] = Field(None, min_length=1, max_length=255)
-    context_data: Optional[Dict[str, Any]] = None
-    is_active: Optional[bool] = None
-    priority: Optional[int] = None
-
-
-class AgentContext(AgentContextBase, TimestampMixin):
-    id: int
 
-    class Config:
-        from_attributes = True
\ No newline at end of file
+# Concrete page types, specialized once here rather than by each router
+AgentTypePage = PaginatedResponse[AgentType]
+AgentPage = PaginatedResponse[Agent]
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Agent context schemas
+"""
+
+from pydantic import BaseModel, Field
+from typing import Optional
+from .base import BoundedJson, TimestampMixin
+
+
+# Agent Context schemas
+class AgentContextBase(BaseModel):
+    agent_id: int
+    context_name: str = Field(..., min_length=1, max_length=255)
+    context_data: BoundedJson
+    is_active: bool = True
+    priority: int = Field(0, description="Higher numbers = higher priority")
+
+
+class AgentContextCreate(AgentContextBase):
+    pass
+
+
+class AgentContextUpdate(BaseModel):
+    context_name: Optional[str] = Field(None, min_length=1, max_length=255)
+    context_data: Optional[BoundedJson] = None
+    is_active: Optional[bool] = None
+    priority: Optional[int] = None
+
+
+class AgentContext(AgentContextBase, TimestampMixin):
+    id: int
\ No newline at end of file
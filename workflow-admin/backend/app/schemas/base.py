@@ -2,32 +2,81 @@
 Base schemas and common utilities
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List, Generic, TypeVar
+from pydantic import AfterValidator, BaseModel, ConfigDict, Field, field_serializer
+from typing import Optional, Any, List, Generic, TypeVar
+from typing_extensions import Annotated
 from datetime import datetime
 from enum import Enum
+import json
+import os
+
+import orjson
+
+
+# Free-form JSON blobs handed to agents are capped so one oversized payload
+# can't bloat every later serialization and LLM prompt that includes it
+SCHEMA_PAYLOAD_MAX_BYTES = int(os.getenv("SCHEMA_PAYLOAD_MAX_BYTES", str(256 * 1024)))
+
+
+def _check_payload_size(value: dict) -> dict:
+    try:
+        size = len(orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS))
+    except TypeError:
+        # orjson rejects integers wider than 64 bits; the stdlib measures those
+        size = len(json.dumps(value).encode())
+    if size > SCHEMA_PAYLOAD_MAX_BYTES:
+        raise ValueError(f"payload is {size} bytes; the limit is {SCHEMA_PAYLOAD_MAX_BYTES}")
+    return value
+
+
+BoundedJson = Annotated[dict, AfterValidator(_check_payload_size)]
 
 
 # Base schemas
-class TimestampMixin(BaseModel):
+class TrustedModel(BaseModel):
+    """Response schema that can be built from ORM rows without re-validation"""
+
+    # Response schemas are never mutated after construction, so already-built
+    # instances nested in a parent are passed through by identity, not re-validated
+    model_config = ConfigDict(from_attributes=True, revalidate_instances='never')
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any):
+        """
+        Build from an ORM instance whose column types the database already guarantees,
+        skipping validation; keep model_validate for untrusted API input
+        """
+        data = {name: getattr(obj, name) for name in cls.model_fields if hasattr(obj, name)}
+        return cls.model_construct(_fields_set=set(data), **data)
+
+    def to_json(self) -> bytes:
+        """Serialize straight to UTF-8 JSON bytes in pydantic-core"""
+        return self.__pydantic_serializer__.to_json(self, by_alias=True)
+
+
+class TimestampMixin(TrustedModel):
     created_at: Optional[datetime] = None
     updated_at: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    @field_serializer('created_at', 'updated_at', when_used='json-unless-none')
+    def _serialize_timestamp(self, value: datetime) -> str:
+        # Audit timestamps only need second precision; dropping the
+        # microseconds shortens every row of a timestamped listing
+        return value.isoformat(timespec='seconds')
 
 
 # Generic response types
 T = TypeVar('T')
 
 
-class PaginatedResponse(BaseModel, Generic[T]):
+class PaginatedResponse(TrustedModel, Generic[T]):
     items: List[T]
-    total: int
+    total: Optional[int] = None  # Counted on offset pages only; None on keyset (after_id) pages
     page: int = 1
     per_page: int = 100
     has_next: bool = False
     has_prev: bool = False
+    next_cursor: Optional[int] = None  # Pass as after_id to fetch the next page
 
 
 class ErrorResponse(BaseModel):
@@ -35,11 +84,10 @@ class ErrorResponse(BaseModel):
     detail: Optional[str] = None
     code: Optional[str] = None
 
-    class Config:
-        schema_extra = {
-            "example": {
-                "error": "Validation Error",
-                "detail": "The provided data is invalid",
-                "code": "VALIDATION_ERROR"
-            }
-        }
\ No newline at end of file
+    model_config = ConfigDict(json_schema_extra={
+        "example": {
+            "error": "Validation Error",
+            "detail": "The provided data is invalid",
+            "code": "VALIDATION_ERROR"
+        }
+    })
\ No newline at end of file
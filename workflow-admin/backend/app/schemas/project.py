@@ -3,7 +3,7 @@ Project-related schemas
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from typing import Optional, List
 from .base import TimestampMixin
 
 
@@ -12,22 +12,19 @@ class ProjectBase(BaseModel):
     name: str = Field(..., min_length=1, max_length=255)
     description: Optional[str] = None
     context: Optional[str] = None
-    settings: Optional[Dict[str, Any]] = None
+    settings: Optional[dict] = None
 
 
 class ProjectCreate(ProjectBase):
-    selected_contexts: Optional[List[int]] = Field(default_factory=list)
+    selected_contexts: Optional[List[int]] = None
 
 
 class ProjectUpdate(BaseModel):
     name: Optional[str] = Field(None, min_length=1, max_length=255)
     description: Optional[str] = None
     context: Optional[str] = None
-    settings: Optional[Dict[str, Any]] = None
+    settings: Optional[dict] = None
 
 
 class Project(ProjectBase, TimestampMixin):
-    id: int
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    id: int
\ No newline at end of file
@@ -3,7 +3,7 @@ Team-related schemas
 """
 
 from pydantic import BaseModel, Field
-from typing import Optional, Dict, Any, List
+from typing import Optional, List
 from .base import TimestampMixin
 
 
@@ -12,11 +12,11 @@ class TeamBase(BaseModel):
     description: Optional[str] = None
     project_id: Optional[int] = None
     team_lead_id: Optional[int] = None
-    configuration: Optional[Dict[str, Any]] = None
+    configuration: Optional[dict] = None
 
 
 class TeamCreate(TeamBase):
-    member_agent_ids: Optional[List[int]] = Field(default_factory=list)
+    member_agent_ids: Optional[List[int]] = None
 
 
 class TeamUpdate(BaseModel):
@@ -24,14 +24,11 @@ class TeamUpdate(BaseModel):
     description: Optional[str] = None
     project_id: Optional[int] = None
     team_lead_id: Optional[int] = None
-    member_agent_ids: Optional[List[int]] = Field(default_factory=list)
-    configuration: Optional[Dict[str, Any]] = None
+    member_agent_ids: Optional[List[int]] = None
+    configuration: Optional[dict] = None
     is_active: Optional[bool] = None
 
 
 class Team(TeamBase, TimestampMixin):
     id: int
-    is_active: bool = True
-
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    is_active: bool = True
\ No newline at end of file
@@ -0,0 +1,46 @@
+"""
+Workflow step schemas
+"""
+
+from pydantic import BaseModel, Field
+from typing import Optional, Literal
+from .base import TimestampMixin
+
+
+# Workflow Step schemas
+StepType = Literal["input", "process", "decision", "output"]
+
+
+class WorkflowStepBase(BaseModel):
+    workflow_id: int
+    step_name: str = Field(..., min_length=1, max_length=255)
+    step_type: StepType
+    sequence_order: int = Field(..., ge=1)
+    context_config: Optional[dict] = None
+    input_schema: Optional[dict] = None
+    output_schema: Optional[dict] = None
+    agent_requirements: Optional[dict] = None
+    estimated_duration: Optional[int] = Field(None, ge=1, description="Duration in minutes")
+    is_required: bool = True
+    conditional_logic: Optional[dict] = None
+
+
+class WorkflowStepCreate(WorkflowStepBase):
+    pass
+
+
+class WorkflowStepUpdate(BaseModel):
+    step_name: Optional[str] = Field(None, min_length=1, max_length=255)
+    step_type: Optional[StepType] = None
+    sequence_order: Optional[int] = Field(None, ge=1)
+    context_config: Optional[dict] = None
+    input_schema: Optional[dict] = None
+    output_schema: Optional[dict] = None
+    agent_requirements: Optional[dict] = None
+    estimated_duration: Optional[int] = Field(None, ge=1, description="Duration in minutes")
+    is_required: Optional[bool] = None
+    conditional_logic: Optional[dict] = None
+
+
+class WorkflowStep(WorkflowStepBase, TimestampMixin):
+    id: int
\ No newline at end of file
@@ -4,70 +4,112 @@ Simple mock API server for testing Newman setup
 This will be replaced by FastAPI later
 """
 
-from flask import Flask, jsonify
+from fastapi.responses import ORJSONResponse
+import orjson
+from starlette.applications import Starlette
+from starlette.responses import Response
+from starlette.routing import Route
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from app.cache import TTLCache
 from app.database.database import get_database_info, check_database_connection
 
-app = Flask(__name__)
+# The root payload never changes, so it is encoded once at import
+ROOT_BODY = orjson.dumps({
+    "message": "Workflow Admin Mock API",
+    "version": "1.0.0",
+    "health_check": "/health",
+    "api_info": "/api/v1/info"
+})
 
-@app.route('/health', methods=['GET'])
-def health_check():
+
+# Probes poll these every second or so; the connection check is shared for a
+# couple of seconds and the table listing, which rarely changes, for longer
+_db_status_cache = TTLCache(maxsize=1, ttl=2.0)
+_db_info_cache = TTLCache(maxsize=1, ttl=10.0)
+
+
+def _cached_db_ok() -> bool:
+    """Database connectivity, re-checked at most once per cache TTL"""
+    db_ok = _db_status_cache.get("ok")
+    if db_ok is None:
+        db_ok = check_database_connection()
+        _db_status_cache.set("ok", db_ok)
+    return db_ok
+
+
+def _cached_db_info() -> dict:
+    """get_database_info(), re-read at most once per cache TTL"""
+    db_info = _db_info_cache.get("info")
+    if db_info is None:
+        db_info = get_database_info()
+        _db_info_cache.set("info", db_info)
+    return db_info
+
+
+# Handlers that touch the database are plain functions; Starlette runs them
+# in its threadpool so the blocking connection check doesn't stall the loop
+def health_check(request):
     """Basic health check endpoint"""
     try:
-        db_status = check_database_connection()
-        return jsonify({
+        db_status = _cached_db_ok()
+        return ORJSONResponse({
             "status": "healthy" if db_status else "unhealthy",
             "database": {
                 "local_connection_ok": db_status
             },
             "message": "Mock API server is running"
-        }), 200
+        })
     except Exception as e:
-        return jsonify({
+        return ORJSONResponse({
             "status": "error",
             "error": str(e)
-        }), 500
+        }, status_code=500)
+
 
-@app.route('/api/v1/info', methods=['GET'])
-def api_info():
+def api_info(request):
     """API information endpoint"""
-    return jsonify({
+    return ORJSONResponse({
         "version": "1.0.0",
         "description": "Workflow Admin API - Mock Version",
-        "database_connected": check_database_connection(),
+        "database_connected": _cached_db_ok(),
         "endpoints": [
             "GET /health",
-            "GET /api/v1/info", 
+            "GET /api/v1/info",
             "GET /api/v1/database/status"
         ]
     })
 
-@app.route('/api/v1/database/status', methods=['GET'])
-def database_status():
+
+def database_status(request):
     """Database status and table information"""
     try:
-        db_info = get_database_info()
-        return jsonify(db_info), 200
+        db_info = _cached_db_info()
+        return ORJSONResponse(db_info)
     except Exception as e:
-        return jsonify({
+        return ORJSONResponse({
             "error": "Failed to get database status",
             "details": str(e)
-        }), 500
+        }, status_code=500)
 
-@app.route('/', methods=['GET'])
-def root():
+
+async def root(request):
     """Root endpoint"""
-    return jsonify({
-        "message": "Workflow Admin Mock API",
-        "version": "1.0.0",
-        "health_check": "/health",
-        "api_info": "/api/v1/info"
-    })
+    return Response(content=ROOT_BODY, media_type="application/json")
+
+
+app = Starlette(routes=[
+    Route('/health', health_check, methods=['GET']),
+    Route('/api/v1/info', api_info, methods=['GET']),
+    Route('/api/v1/database/status', database_status, methods=['GET']),
+    Route('/', root, methods=['GET']),
+])
 
 if __name__ == '__main__':
+    import uvicorn
+
     print("🚀 Starting Mock API Server...")
     print("📊 Database connection:", "✅" if check_database_connection() else "❌")
-    app.run(host='0.0.0.0', port=8000, debug=True)
\ No newline at end of file
+    uvicorn.run(app, host='0.0.0.0', port=8000)
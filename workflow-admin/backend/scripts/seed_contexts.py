@@ -11,8 +11,9 @@ from sqlalchemy.orm import Session
 # Add the parent directory to Python path to import our modules
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from app.database.database import get_db, engine
-from sqlalchemy.orm import sessionmaker
+from app.database.database import SessionLocal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from app.database.models import OrganizationalContext
 
 def create_sample_contexts(db: Session):
@@ -21,8 +22,8 @@ def create_sample_contexts(db: Session):
     # Tech Stack contexts
     tech_contexts = [
         {
-            'context_category': 'tech_standards',
-            'context_name': 'React TypeScript Stack',
+            'category': 'tech_standards',
+            'name': 'React TypeScript Stack',
             'description': 'Modern React web application with TypeScript',
             'content': {
                 'summary': 'React + TypeScript + Material-UI frontend stack',
@@ -37,15 +38,15 @@ def create_sample_contexts(db: Session):
                     'Component composition over inheritance',
                     'Proper error boundaries',
                     'Consistent state management patterns'
-                ]
+                ],
+                'tags': ['frontend', 'react', 'typescript', 'web']
             },
-            'applicable_agent_types': ['frontend_developer', 'full_stack_developer'],
-            'priority': 8,
-            'tags': ['frontend', 'react', 'typescript', 'web']
+            'applies_to': ['frontend_developer', 'full_stack_developer'],
+            'priority': 8
         },
         {
-            'context_category': 'tech_standards',
-            'context_name': 'FastAPI Python Backend',
+            'category': 'tech_standards',
+            'name': 'FastAPI Python Backend',
             'description': 'Python FastAPI backend with SQLAlchemy',
             'content': {
                 'summary': 'FastAPI + SQLAlchemy + PostgreSQL backend stack',
@@ -60,15 +61,15 @@ def create_sample_contexts(db: Session):
                     'Async/await for database operations',
                     'Proper dependency injection',
                     'Comprehensive API documentation'
-                ]
+                ],
+                'tags': ['backend', 'python', 'fastapi', 'api']
             },
-            'applicable_agent_types': ['backend_developer', 'full_stack_developer'],
-            'priority': 8,
-            'tags': ['backend', 'python', 'fastapi', 'api']
+            'applies_to': ['backend_developer', 'full_stack_developer'],
+            'priority': 8
         },
         {
-            'context_category': 'tech_standards',
-            'context_name': 'Docker Containerization',
+            'category': 'tech_standards',
+            'name': 'Docker Containerization',
             'description': 'Docker containerization standards',
             'content': {
                 'summary': 'Docker containers with Docker Compose orchestration',
@@ -84,19 +85,19 @@ def create_sample_contexts(db: Session):
                     'Non-root user execution',
                     'Proper health checks',
                     'Layer caching optimization'
-                ]
+                ],
+                'tags': ['devops', 'docker', 'containers', 'deployment']
             },
-            'applicable_agent_types': ['devops_engineer', 'backend_developer'],
-            'priority': 7,
-            'tags': ['devops', 'docker', 'containers', 'deployment']
+            'applies_to': ['devops_engineer', 'backend_developer'],
+            'priority': 7
         }
     ]
     
     # Security contexts
     security_contexts = [
         {
-            'context_category': 'security',
-            'context_name': 'API Security Standards',
+            'category': 'security',
+            'name': 'API Security Standards',
             'description': 'Security requirements for API development',
             'content': {
                 'summary': 'Comprehensive API security guidelines',
@@ -117,15 +118,15 @@ def create_sample_contexts(db: Session):
                     'Pydantic models for request validation',
                     'Size limits on file uploads',
                     'Whitelist allowed file types'
-                ]
+                ],
+                'tags': ['security', 'api', 'authentication', 'validation']
             },
-            'applicable_agent_types': ['backend_developer', 'security_engineer'],
-            'priority': 9,
-            'tags': ['security', 'api', 'authentication', 'validation']
+            'applies_to': ['backend_developer', 'security_engineer'],
+            'priority': 9
         },
         {
-            'context_category': 'security',
-            'context_name': 'Data Protection',
+            'category': 'security',
+            'name': 'Data Protection',
             'description': 'Data handling and protection standards',
             'content': {
                 'summary': 'Data encryption and privacy protection requirements',
@@ -145,19 +146,19 @@ def create_sample_contexts(db: Session):
                     'Data minimization principles',
                     'User consent tracking',
                     'Right to deletion support'
-                ]
+                ],
+                'tags': ['security', 'data', 'encryption', 'privacy']
             },
-            'applicable_agent_types': ['backend_developer', 'security_engineer', 'dba'],
-            'priority': 10,
-            'tags': ['security', 'data', 'encryption', 'privacy']
+            'applies_to': ['backend_developer', 'security_engineer', 'dba'],
+            'priority': 10
         }
     ]
     
     # Compliance contexts
     compliance_contexts = [
         {
-            'context_category': 'compliance',
-            'context_name': 'GDPR Compliance',
+            'category': 'compliance',
+            'name': 'GDPR Compliance',
             'description': 'General Data Protection Regulation requirements',
             'content': {
                 'summary': 'GDPR compliance for EU data processing',
@@ -179,15 +180,15 @@ def create_sample_contexts(db: Session):
                     'Data erasure',
                     'Data portability',
                     'Processing restriction'
-                ]
+                ],
+                'tags': ['compliance', 'gdpr', 'privacy', 'data-protection']
             },
-            'applicable_agent_types': ['backend_developer', 'product_manager', 'legal'],
-            'priority': 9,
-            'tags': ['compliance', 'gdpr', 'privacy', 'data-protection']
+            'applies_to': ['backend_developer', 'product_manager', 'legal'],
+            'priority': 9
         },
         {
-            'context_category': 'compliance',
-            'context_name': 'Accessibility Standards',
+            'category': 'compliance',
+            'name': 'Accessibility Standards',
             'description': 'WCAG 2.1 AA accessibility compliance',
             'content': {
                 'summary': 'Web accessibility guidelines compliance',
@@ -208,19 +209,19 @@ def create_sample_contexts(db: Session):
                     'ARIA labels where needed',
                     'Focus management',
                     'Responsive design principles'
-                ]
+                ],
+                'tags': ['compliance', 'accessibility', 'wcag', 'ui']
             },
-            'applicable_agent_types': ['frontend_developer', 'ui_designer', 'qa_engineer'],
-            'priority': 8,
-            'tags': ['compliance', 'accessibility', 'wcag', 'ui']
+            'applies_to': ['frontend_developer', 'ui_designer', 'qa_engineer'],
+            'priority': 8
         }
     ]
     
     # Business Guidelines contexts
     business_contexts = [
         {
-            'context_category': 'business_guidelines',
-            'context_name': 'Agile Development Process',
+            'category': 'business_guidelines',
+            'name': 'Agile Development Process',
             'description': 'Agile methodology and sprint planning guidelines',
             'content': {
                 'summary': 'Scrum-based agile development process',
@@ -243,15 +244,15 @@ def create_sample_contexts(db: Session):
                     'communication': 'Slack',
                     'documentation': 'Confluence',
                     'version_control': 'Git'
-                }
+                },
+                'tags': ['business', 'agile', 'scrum', 'process']
             },
-            'applicable_agent_types': ['product_manager', 'scrum_master', 'developer'],
-            'priority': 7,
-            'tags': ['business', 'agile', 'scrum', 'process']
+            'applies_to': ['product_manager', 'scrum_master', 'developer'],
+            'priority': 7
         },
         {
-            'context_category': 'business_guidelines',
-            'context_name': 'Code Quality Standards',
+            'category': 'business_guidelines',
+            'name': 'Code Quality Standards',
             'description': 'Code review and quality assurance guidelines',
             'content': {
                 'summary': 'Code quality and review process standards',
@@ -277,41 +278,43 @@ def create_sample_contexts(db: Session):
                     'API documentation (OpenAPI)',
                     'Architecture decision records',
                     'Deployment guides'
-                ]
+                ],
+                'tags': ['business', 'quality', 'code-review', 'testing']
             },
-            'applicable_agent_types': ['developer', 'tech_lead', 'qa_engineer'],
-            'priority': 8,
-            'tags': ['business', 'quality', 'code-review', 'testing']
+            'applies_to': ['developer', 'tech_lead', 'qa_engineer'],
+            'priority': 8
         }
     ]
     
     # Combine all contexts
     all_contexts = tech_contexts + security_contexts + compliance_contexts + business_contexts
     
-    # Insert contexts into database
+    # Executemany form: SQLAlchemy batches the rows into multi-VALUES INSERTs
+    # (insertmanyvalues, page size set on the engine) from one cached statement;
+    # the (category, name) unique constraint skips contexts that already exist
+    insert = pg_insert if db.bind.dialect.name == "postgresql" else sqlite_insert
+    created = set(db.execute(
+        insert(OrganizationalContext)
+        .on_conflict_do_nothing(index_elements=["category", "name"])
+        .returning(OrganizationalContext.category, OrganizationalContext.name),
+        all_contexts
+    ).all())
+    db.commit()
+    
     for context_data in all_contexts:
-        # Check if context already exists
-        existing = db.query(OrganizationalContext).filter(
-            OrganizationalContext.context_category == context_data['context_category'],
-            OrganizationalContext.context_name == context_data['context_name']
-        ).first()
-        
-        if not existing:
-            context = OrganizationalContext(**context_data)
-            db.add(context)
-            print(f"Created context: {context_data['context_category']} - {context_data['context_name']}")
+        key = (context_data['category'], context_data['name'])
+        if key in created:
+            print(f"Created context: {key[0]} - {key[1]}")
         else:
-            print(f"Context already exists: {context_data['context_category']} - {context_data['context_name']}")
+            print(f"Context already exists: {key[0]} - {key[1]}")
     
-    db.commit()
     print(f"\n✅ Successfully processed {len(all_contexts)} organizational contexts")
 
 def main():
     """Main function to seed contexts"""
     print("🌱 Seeding organizational contexts...")
     
-    # Create database session
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    # Shared session factory, so the script gets the app's engine and session settings
     db = SessionLocal()
     
     try:
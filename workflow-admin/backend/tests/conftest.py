@@ -1,22 +1,23 @@
 import pytest
 import os
-from sqlalchemy import create_engine
+import uuid
 from sqlalchemy.orm import sessionmaker
 from fastapi.testclient import TestClient
+
+# Point the app's own engines (sync and async) at the test database before the
+# app is imported, so endpoints that open their own sessions see the test data
+os.environ["DATABASE_URL"] = "sqlite:///./data/test/test_workflow_admin.db"
+
 from app.database.models import Base, Project, Workflow, WorkflowRun, WorkflowTemplate, Agent, AgentType, Team, TeamMember
 from app.main import app
-from app.database.database import get_db
+from app.database.database import engine, get_db
 
 
 @pytest.fixture(scope="session")
 def test_engine():
-    """Create test database engine"""
-    test_db_url = "sqlite:///./data/test/test_workflow_admin.db"
-    
-    # Ensure test directory exists
-    os.makedirs("data/test", exist_ok=True)
-    
-    engine = create_engine(test_db_url, echo=True)
+    """Create the test database tables on the app's engine"""
+    # Start from empty tables even if an earlier run was interrupted
+    Base.metadata.drop_all(bind=engine)
     Base.metadata.create_all(bind=engine)
     yield engine
     
@@ -99,7 +100,7 @@ def test_client(test_session):
 def sample_agent_type(test_session):
     """Create sample agent type for testing"""
     agent_type = AgentType(
-        name="Test Agent Type",
+        name=f"Test Agent Type {uuid.uuid4().hex[:8]}",  # unique: the table persists across tests
         description="A test agent type for API testing",
         capabilities={
             "skills": ["testing", "automation"],
@@ -0,0 +1,134 @@
+"""
+Agent API tests
+
+Agent and agent type endpoints, including the denormalized agent_type_name.
+"""
+
+from sqlalchemy import select
+from sqlalchemy.orm import raiseload
+
+from app.database.models import Agent
+
+
+def test_agent_repr_does_not_load_agent_type(test_session, sample_agent):
+    """__repr__ reads the denormalized name, so it is safe under raiseload("*")"""
+    test_session.expunge_all()
+    agent = test_session.scalars(
+        select(Agent).options(raiseload("*")).where(Agent.id == sample_agent.id)
+    ).one()
+    assert repr(agent) == f"<Agent(id={agent.id}, name='TestAgent', type='{agent.agent_type_name}')>"
+    assert agent.agent_type_name is not None
+
+
+def test_list_and_get_agent(test_client, sample_agent):
+    """List and detail views return the denormalized type name"""
+    response = test_client.get("/api/v1/agents/", params={"agent_type_id": sample_agent.agent_type_id})
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["items"]] == [sample_agent.id]
+
+    response = test_client.get(f"/api/v1/agents/{sample_agent.id}")
+    assert response.status_code == 200
+    assert response.json()["agent_type_name"] == sample_agent.agent_type_name
+
+
+def test_create_agent_reads_type_name_in_the_insert(test_client, sample_agent_type):
+    """The new agent carries the type's current name, and an unknown type is a 400"""
+    response = test_client.post("/api/v1/agents/", json={
+        "name": "CreatedAgent",
+        "agent_type_id": sample_agent_type.id,
+        "configuration": {"n": 1}
+    })
+    assert response.status_code == 200
+    body = response.json()
+    assert body["agent_type_name"] == sample_agent_type.name
+    assert body["configuration"] == {"n": 1}
+    assert body["created_at"] is not None
+
+    response = test_client.post("/api/v1/agents/", json={"name": "Orphan", "agent_type_id": 999999})
+    assert response.status_code == 400
+
+
+def test_agent_type_rename_reaches_agents(test_client, sample_agent):
+    """Renaming a type rewrites agent_type_name with no stale in-process copy"""
+    new_name = f"{sample_agent.agent_type_name} renamed"
+    response = test_client.put(f"/api/v1/agents/types/{sample_agent.agent_type_id}", json={"name": new_name})
+    assert response.status_code == 200
+
+    response = test_client.get(f"/api/v1/agents/{sample_agent.id}")
+    assert response.json()["agent_type_name"] == new_name
+
+    response = test_client.post("/api/v1/agents/", json={"name": "AfterRename", "agent_type_id": sample_agent.agent_type_id})
+    assert response.json()["agent_type_name"] == new_name
+
+
+def test_update_agent_type_id(test_client, test_session, sample_agent):
+    """Moving an agent to another type refreshes the name; an unknown type is a 400"""
+    response = test_client.post("/api/v1/agents/types", json={
+        "name": f"Other {sample_agent.agent_type_name}",
+        "capabilities": {}
+    })
+    other_type = response.json()
+
+    response = test_client.put(f"/api/v1/agents/{sample_agent.id}", json={"agent_type_id": other_type["id"]})
+    assert response.status_code == 200
+    assert response.json()["agent_type_name"] == other_type["name"]
+
+    response = test_client.put(f"/api/v1/agents/{sample_agent.id}", json={"agent_type_id": 999999})
+    assert response.status_code == 400
+    response = test_client.get(f"/api/v1/agents/{sample_agent.id}")
+    assert response.json()["agent_type_id"] == other_type["id"]
+
+
+def test_agent_keyset_pages(test_client, sample_agent_type):
+    """The first page counts the total; after_id pages seek without counting"""
+    for name in ("KeysetA", "KeysetB", "KeysetC"):
+        test_client.post("/api/v1/agents/", json={"name": name, "agent_type_id": sample_agent_type.id})
+    params = {"agent_type_id": sample_agent_type.id, "limit": 2}
+
+    first = test_client.get("/api/v1/agents/", params=params).json()
+    assert first["total"] == 3 and first["has_next"]
+    assert first["next_cursor"] == first["items"][-1]["id"]
+
+    second = test_client.get("/api/v1/agents/", params={**params, "after_id": first["next_cursor"]}).json()
+    assert second["total"] is None
+    assert [item["name"] for item in second["items"]] == ["KeysetC"]
+    assert not second["has_next"] and second["has_prev"]
+
+
+def test_bulk_create_agents(test_client, sample_agent_type):
+    """One request creates every agent, in request order, with the type name filled in"""
+    names = [f"Bulk{i}" for i in range(5)]
+    response = test_client.post("/api/v1/agents/bulk", json=[
+        {"name": name, "agent_type_id": sample_agent_type.id, "configuration": {"i": i}}
+        for i, name in enumerate(names)
+    ])
+    assert response.status_code == 200
+    agents = response.json()
+    assert [agent["name"] for agent in agents] == names
+    assert [agent["configuration"] for agent in agents] == [{"i": i} for i in range(5)]
+    assert {agent["agent_type_name"] for agent in agents} == {sample_agent_type.name}
+    assert agents == sorted(agents, key=lambda agent: agent["id"])
+
+
+def test_bulk_create_agents_rejects_unknown_types(test_client, sample_agent_type):
+    """Any unknown agent_type_id fails the whole batch with a 400"""
+    response = test_client.post("/api/v1/agents/bulk", json=[
+        {"name": "BulkOk", "agent_type_id": sample_agent_type.id},
+        {"name": "BulkMissing", "agent_type_id": 999999}
+    ])
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Agent type not found: [999999]"
+
+    response = test_client.get("/api/v1/agents/", params={"agent_type_id": sample_agent_type.id})
+    assert response.json()["items"] == []
+
+
+def test_bulk_create_agents_validates_the_body(test_client):
+    """The body is validated from raw bytes; bad items are a 422 and [] is a no-op"""
+    response = test_client.post("/api/v1/agents/bulk", json=[{"name": "NoType"}])
+    assert response.status_code == 422
+    assert response.json()["detail"][0]["loc"][:2] == ["body", 0]
+
+    response = test_client.post("/api/v1/agents/bulk", json=[])
+    assert response.status_code == 200
+    assert response.json() == []
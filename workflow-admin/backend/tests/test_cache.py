@@ -0,0 +1,41 @@
+"""
+TTLCache tests
+
+Expiry, LRU eviction and version bumps of the in-process cache.
+"""
+
+from app.cache import TTLCache
+
+
+def test_entries_expire(monkeypatch):
+    """An entry older than ttl reads as missing"""
+    now = [1000.0]
+    monkeypatch.setattr("app.cache.time.monotonic", lambda: now[0])
+    cache = TTLCache(maxsize=4, ttl=10)
+    cache.set("k", "v")
+    now[0] += 9
+    assert cache.get("k") == "v"
+    now[0] += 2
+    assert cache.get("k", "missing") == "missing"
+
+
+def test_least_recently_used_is_evicted():
+    """Past maxsize the entry read least recently is dropped"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+
+def test_invalidate_clears_and_bumps_version():
+    """invalidate() empties the cache and moves callers to new keys"""
+    cache = TTLCache()
+    version = cache.version
+    cache.set((version, "k"), "v")
+    cache.invalidate()
+    assert cache.version == version + 1
+    assert cache.get((version, "k")) is None
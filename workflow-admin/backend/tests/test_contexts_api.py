@@ -0,0 +1,141 @@
+"""
+Organizational context API tests
+
+Create, list and cache behaviour of /api/v1/contexts.
+"""
+
+import uuid
+
+from sqlalchemy import func, select
+
+from app.database.models import OrganizationalContext
+from app.schemas.base import SCHEMA_PAYLOAD_MAX_BYTES
+from scripts.seed_contexts import create_sample_contexts
+
+
+def _context(**overrides):
+    """Request body for a new context with a unique name"""
+    body = {
+        "category": "testing",
+        "name": f"Context {uuid.uuid4().hex[:8]}",
+        "content": {"rule": "value"}
+    }
+    body.update(overrides)
+    return body
+
+
+def test_oversized_content_is_rejected(test_client):
+    """Content above SCHEMA_PAYLOAD_MAX_BYTES fails validation"""
+    response = test_client.post("/api/v1/contexts/", json=_context(
+        content={"blob": "x" * (SCHEMA_PAYLOAD_MAX_BYTES + 1)}
+    ))
+    assert response.status_code == 422
+
+
+def test_big_int_content_is_accepted(test_client):
+    """Integers wider than 64 bits are measured and stored rather than a 500"""
+    big = 2 ** 70
+    response = test_client.post("/api/v1/contexts/", json=_context(content={"n": big}))
+    assert response.status_code == 200
+    assert response.json()["content"] == {"n": big}
+
+
+def test_keyset_cursor_walks_the_listing(test_client):
+    """X-Next-Cursor pages through (priority DESC, name, id) with no overlap or gap"""
+    category = f"keyset-{uuid.uuid4().hex[:8]}"
+    for name, priority in (("b", 5), ("a", 5), ("c", 9), ("d", 1)):
+        test_client.post("/api/v1/contexts/", json=_context(category=category, name=name, priority=priority))
+
+    names, cursor = [], None
+    while True:
+        params = {"category": category, "limit": 3}
+        if cursor:
+            params["cursor"] = cursor
+        response = test_client.get("/api/v1/contexts/", params=params)
+        assert response.status_code == 200
+        names += [context["name"] for context in response.json()]
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            break
+    assert names == ["c", "a", "b", "d"]
+
+
+def test_invalid_cursor_is_rejected(test_client):
+    """A cursor that doesn't decode to (priority, name, id) is a 400"""
+    response = test_client.get("/api/v1/contexts/", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_duplicate_create_conflicts(test_client):
+    """A second create with the same (category, name) is a 400 from ON CONFLICT DO NOTHING"""
+    body = _context()
+    first = test_client.post("/api/v1/contexts/", json=body)
+    assert first.status_code == 200
+
+    second = test_client.post("/api/v1/contexts/", json={**body, "content": {"other": True}})
+    assert second.status_code == 400
+
+    response = test_client.get(f"/api/v1/contexts/{first.json()['id']}")
+    assert response.status_code == 200
+    assert response.json()["content"] == body["content"]
+
+
+def test_rename_onto_existing_name_conflicts(test_client):
+    """Renaming a context to a name its category already has is the same 400 as create"""
+    category = f"rename-{uuid.uuid4().hex[:8]}"
+    first = test_client.post("/api/v1/contexts/", json=_context(category=category, name="first")).json()
+    second = test_client.post("/api/v1/contexts/", json=_context(category=category, name="second")).json()
+
+    response = test_client.put(f"/api/v1/contexts/{second['id']}", json={"name": "first"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == f"Context 'first' already exists in category '{category}'"
+
+    assert test_client.get(f"/api/v1/contexts/{second['id']}").json()["name"] == "second"
+    assert test_client.get(f"/api/v1/contexts/{first['id']}").json()["name"] == "first"
+
+
+def test_writes_invalidate_cached_listings(test_client):
+    """Listings and categories are cached, and a create or update is visible on the next read"""
+    category = f"cache-{uuid.uuid4().hex[:8]}"
+    assert category not in test_client.get("/api/v1/contexts/categories").json()
+    assert test_client.get("/api/v1/contexts/", params={"category": category}).json() == []
+
+    created = test_client.post("/api/v1/contexts/", json=_context(category=category)).json()
+    assert category in test_client.get("/api/v1/contexts/categories").json()
+    listing = test_client.get("/api/v1/contexts/", params={"category": category}).json()
+    assert [context["id"] for context in listing] == [created["id"]]
+
+    test_client.put(f"/api/v1/contexts/{created['id']}", json={"priority": 7})
+    listing = test_client.get("/api/v1/contexts/", params={"category": category}).json()
+    assert listing[0]["priority"] == 7
+
+
+def test_selectable_contexts_etag(test_client):
+    """A matching If-None-Match is a bodiless 304 until a write changes the ETag"""
+    response = test_client.get("/api/v1/contexts/selectable/project-contexts")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+
+    response = test_client.get("/api/v1/contexts/selectable/project-contexts", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.content == b""
+    assert response.headers["etag"] == etag
+
+    response = test_client.get(
+        "/api/v1/contexts/selectable/project-contexts", headers={"If-None-Match": f'W/"other", {etag}'}
+    )
+    assert response.status_code == 304
+
+    created = test_client.post("/api/v1/contexts/", json=_context(category="security")).json()
+    response = test_client.get("/api/v1/contexts/selectable/project-contexts", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+    assert created["id"] in [context["id"] for context in response.json()["security"]]
+
+
+def test_seed_script_is_idempotent(test_session):
+    """Re-running the seed inserts nothing: existing (category, name) pairs are skipped"""
+    create_sample_contexts(test_session)
+    count = test_session.scalar(select(func.count()).select_from(OrganizationalContext))
+    create_sample_contexts(test_session)
+    assert test_session.scalar(select(func.count()).select_from(OrganizationalContext)) == count
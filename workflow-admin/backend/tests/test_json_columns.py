@@ -0,0 +1,42 @@
+"""
+JSON column encoding tests
+
+Values the stdlib json module accepts must survive a round trip through
+the orjson-backed column serializer.
+"""
+
+import math
+import uuid
+
+from sqlalchemy import text
+
+
+def test_big_int_in_json_column_round_trips(test_client):
+    """Integers wider than 64 bits are stored and read back exactly"""
+    big = 2 ** 70
+    response = test_client.post("/api/v1/agents/types", json={
+        "name": f"Big int {uuid.uuid4().hex[:8]}",
+        "capabilities": {"n": big}
+    })
+    assert response.status_code == 200
+    assert response.json()["capabilities"] == {"n": big}
+
+    agent_type_id = response.json()["id"]
+    response = test_client.get(f"/api/v1/agents/types/{agent_type_id}")
+    assert response.status_code == 200
+    assert response.json()["capabilities"] == {"n": big}
+
+
+def test_stdlib_written_nan_is_readable(test_client, test_session, sample_agent_type):
+    """Rows holding NaN/Infinity, as written by the stdlib encoder, still load"""
+    test_session.execute(
+        text("UPDATE agent_types SET capabilities = :capabilities WHERE id = :id"),
+        {"capabilities": '{"ratio": NaN, "limit": Infinity}', "id": sample_agent_type.id}
+    )
+    test_session.commit()
+
+    response = test_client.get(f"/api/v1/agents/types/{sample_agent_type.id}")
+    assert response.status_code == 200
+    capabilities = response.json()["capabilities"]
+    assert math.isnan(capabilities["ratio"])
+    assert capabilities["limit"] == math.inf
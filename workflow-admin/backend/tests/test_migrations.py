@@ -0,0 +1,210 @@
+"""
+Alembic migration tests
+
+Each revision is applied to a throwaway SQLite database laid out as an
+older release left it.
+"""
+
+from datetime import datetime
+from decimal import Decimal
+
+import pytest
+from alembic import command
+from alembic.config import Config
+from sqlalchemy import DateTime, Float, MetaData, Numeric, String, Table, create_engine, insert, inspect, select
+
+from app.database.models import AgentPerformance, Base, WorkflowRun
+
+
+@pytest.fixture
+def legacy_database(tmp_path, monkeypatch):
+    """
+    Factory for a database with the current tables minus the given columns
+    and without table-level constraints or indexes, as create_all built
+    them before those were declared on the models
+    """
+    url = f"sqlite:///{tmp_path / 'legacy.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    engine = create_engine(url)
+
+    def create(tables=None, drop_columns=None, retype=None):
+        drop_columns = drop_columns or {}
+        retype = retype or {}
+        metadata = MetaData()
+        for table in Base.metadata.sorted_tables:
+            if tables is not None and table.name not in tables:
+                continue
+            columns = []
+            for column in table.columns:
+                if column.name in drop_columns.get(table.name, ()):
+                    continue
+                column = column._copy()
+                if (table.name, column.name) in retype:
+                    column.type = retype[(table.name, column.name)]
+                columns.append(column)
+            Table(table.name, metadata, *columns)
+        metadata.create_all(engine)
+        return metadata
+
+    yield engine, create
+    engine.dispose()
+
+
+def upgrade_to_head():
+    """Apply every revision to the database named by DATABASE_URL"""
+    command.upgrade(Config("alembic.ini"), "head")
+
+
+def test_unique_category_name_dedupes_existing_rows(legacy_database):
+    """Duplicate (category, name) rows are removed and the constraint is added"""
+    engine, create = legacy_database
+    table = create(tables={"organizational_contexts"}).tables["organizational_contexts"]
+    with engine.begin() as connection:
+        connection.execute(insert(table), [
+            {"category": "security", "name": "S1", "content": {"v": 1}},
+            {"category": "security", "name": "S1", "content": {"v": 2}},
+            {"category": "security", "name": "S2", "content": {"v": 3}},
+        ])
+
+    upgrade_to_head()
+
+    constraints = inspect(engine).get_unique_constraints("organizational_contexts")
+    assert ["uq_org_ctx_category_name"] == [c["name"] for c in constraints]
+    with engine.connect() as connection:
+        rows = connection.execute(select(table.c.name, table.c.content).order_by(table.c.id)).all()
+    assert [tuple(row) for row in rows] == [("S1", {"v": 1}), ("S2", {"v": 3})]
+
+
+def test_agent_type_name_is_added_and_backfilled(legacy_database):
+    """Agents from before the denormalized column get it, indexed and filled from agent_types"""
+    engine, create = legacy_database
+    metadata = create(drop_columns={"agents": {"agent_type_name"}})
+    agent_types, agents = metadata.tables["agent_types"], metadata.tables["agents"]
+    with engine.begin() as connection:
+        connection.execute(insert(agent_types), [
+            {"id": 1, "name": "Developer", "capabilities": {}},
+            {"id": 2, "name": "Tester", "capabilities": {}},
+        ])
+        connection.execute(insert(agents), [
+            {"name": "AgentIan", "agent_type_id": 1},
+            {"name": "AgentPete", "agent_type_id": 2},
+        ])
+
+    upgrade_to_head()
+
+    assert "ix_agents_agent_type_name" in [index["name"] for index in inspect(engine).get_indexes("agents")]
+    with engine.connect() as connection:
+        rows = connection.exec_driver_sql("SELECT name, agent_type_name FROM agents ORDER BY id").all()
+    assert [tuple(row) for row in rows] == [("AgentIan", "Developer"), ("AgentPete", "Tester")]
+
+
+def test_current_schema_upgrades_as_a_no_op(tmp_path, monkeypatch):
+    """A database create_all built from the current models passes through every revision unchanged"""
+    url = f"sqlite:///{tmp_path / 'current.db'}"
+    monkeypatch.setenv("DATABASE_URL", url)
+    engine = create_engine(url)
+    Base.metadata.create_all(engine)
+    before = {name: inspect(engine).get_columns(name) for name in Base.metadata.tables}
+
+    upgrade_to_head()
+
+    after = {name: inspect(engine).get_columns(name) for name in Base.metadata.tables}
+    assert repr(after) == repr(before)
+    engine.dispose()
+
+
+def test_timestamp_strings_become_datetimes(legacy_database):
+    """ISO string timestamps are normalised to UTC and the columns become DATETIME"""
+    engine, create = legacy_database
+    metadata = create(retype={
+        ("workflow_runs", "started_at"): String(), ("workflow_runs", "completed_at"): String(),
+        ("workflow_assignments", "assigned_at"): String(), ("workflow_assignments", "started_at"): String(),
+        ("workflow_assignments", "completed_at"): String(),
+    })
+    with engine.begin() as connection:
+        connection.execute(insert(metadata.tables["projects"]), {"id": 1, "name": "P"})
+        connection.execute(insert(metadata.tables["workflows"]), {"id": 1, "name": "W", "project_id": 1, "definition": {}})
+        connection.execute(insert(metadata.tables["workflow_runs"]), [
+            {"workflow_id": 1, "run_id": "zulu", "started_at": "2025-08-31T18:15:47Z", "completed_at": "2025-08-31T19:00:00.250+02:00"},
+            {"workflow_id": 1, "run_id": "naive", "started_at": "2025-08-31 18:15:47", "completed_at": ""},
+            {"workflow_id": 1, "run_id": "garbage", "started_at": "yesterday", "completed_at": None},
+        ])
+
+    upgrade_to_head()
+
+    columns = {column["name"]: column["type"] for column in inspect(engine).get_columns("workflow_runs")}
+    assert isinstance(columns["started_at"], DateTime) and isinstance(columns["completed_at"], DateTime)
+    columns = {column["name"]: column["type"] for column in inspect(engine).get_columns("workflow_assignments")}
+    assert all(isinstance(columns[name], DateTime) for name in ("assigned_at", "started_at", "completed_at"))
+
+    runs = WorkflowRun.__table__
+    with engine.connect() as connection:
+        rows = connection.execute(select(runs.c.run_id, runs.c.started_at, runs.c.completed_at).order_by(runs.c.id)).all()
+    assert [tuple(row) for row in rows] == [
+        ("zulu", datetime(2025, 8, 31, 18, 15, 47), datetime(2025, 8, 31, 17, 0, 0, 250000)),
+        ("naive", datetime(2025, 8, 31, 18, 15, 47), None),
+        ("garbage", None, None),
+    ]
+
+
+def test_performance_value_becomes_float(legacy_database):
+    """NUMERIC(10, 4) performance values become FLOAT with their values intact"""
+    engine, create = legacy_database
+    metadata = create(retype={("agent_performance", "value"): Numeric(10, 4)})
+    with engine.begin() as connection:
+        connection.execute(insert(metadata.tables["agent_types"]), {"id": 1, "name": "Developer", "capabilities": {}})
+        connection.execute(insert(metadata.tables["agents"]), {"id": 1, "name": "AgentIan", "agent_type_id": 1})
+        connection.execute(insert(metadata.tables["agent_performance"]), [
+            {"agent_id": 1, "metric_type": "quality_score", "value": Decimal("0.9375")},
+            {"agent_id": 1, "metric_type": "completion_rate", "value": Decimal("12")},
+        ])
+
+    upgrade_to_head()
+
+    columns = {column["name"]: column for column in inspect(engine).get_columns("agent_performance")}
+    assert isinstance(columns["value"]["type"], Float) and not columns["value"]["nullable"]
+    performance = AgentPerformance.__table__
+    with engine.connect() as connection:
+        values = connection.execute(select(performance.c.value).order_by(performance.c.id)).scalars().all()
+    assert values == [0.9375, 12.0]
+
+
+def _index_names(engine) -> set:
+    """Every index name on every table"""
+    inspector = inspect(engine)
+    return {index["name"] for table in inspector.get_table_names() for index in inspector.get_indexes(table)}
+
+
+def test_agent_list_filter_indexes_are_added(legacy_database):
+    """The agent and agent type list-filter indexes are built on an older database"""
+    engine, create = legacy_database
+    create()
+    assert not {"ix_agent_types_active_name", "ix_agents_status_type", "ix_agents_type_status"} & _index_names(engine)
+
+    upgrade_to_head()
+
+    assert {"ix_agent_types_active_name", "ix_agents_status_type", "ix_agents_type_status"} <= _index_names(engine)
+
+
+def test_agent_keyset_index_is_added(legacy_database):
+    """The (status, id) keyset index is built on an older database"""
+    engine, create = legacy_database
+    create()
+
+    upgrade_to_head()
+
+    assert "ix_agents_status_id" in _index_names(engine)
+
+
+def test_list_filter_indexes_are_added(legacy_database):
+    """After every revision an older database has all the indexes the models declare"""
+    engine, create = legacy_database
+    create()
+
+    upgrade_to_head()
+
+    declared = {
+        index.name for table in Base.metadata.tables.values() for index in table.indexes
+        if not index.dialect_options["postgresql"]["using"]  # GIN/BRIN are PostgreSQL only
+    }
+    assert declared <= _index_names(engine)
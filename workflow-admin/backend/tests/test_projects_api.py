@@ -0,0 +1,55 @@
+"""
+Project API tests
+
+Project endpoints and the combined project dashboard.
+"""
+
+from sqlalchemy import event
+
+from app.database.database import async_engine
+
+
+def test_dashboard_combines_project_teams_workflows(test_client, sample_team, sample_workflow):
+    """The dashboard returns the project with its active teams, workflows and selectable contexts"""
+    project_id = sample_team.project_id
+    response = test_client.get(f"/api/v1/projects/{project_id}/dashboard")
+    assert response.status_code == 200
+    dashboard = response.json()
+    assert dashboard["project"]["id"] == project_id
+    assert [team["id"] for team in dashboard["teams"]] == [sample_team.id]
+    assert [workflow["id"] for workflow in dashboard["workflows"]] == [sample_workflow.id]
+    assert isinstance(dashboard["selectable_contexts"], dict)
+
+
+def test_dashboard_unknown_project(test_client):
+    """An unknown project is a 404"""
+    response = test_client.get("/api/v1/projects/999999/dashboard")
+    assert response.status_code == 404
+
+
+def test_dashboard_uses_one_connection(test_client, sample_project):
+    """All of the dashboard's queries share the request's one pooled connection"""
+    checkouts = []
+
+    def on_checkout(*args):
+        checkouts.append(args)
+
+    event.listen(async_engine.sync_engine, "checkout", on_checkout)
+    try:
+        response = test_client.get(f"/api/v1/projects/{sample_project.id}/dashboard")
+    finally:
+        event.remove(async_engine.sync_engine, "checkout", on_checkout)
+    assert response.status_code == 200
+    assert len(checkouts) == 1
+
+
+def test_dashboard_big_int_settings(test_client):
+    """Integers wider than 64 bits in project settings come back exact"""
+    big = 2 ** 70
+    response = test_client.post("/api/v1/projects/", json={"name": "Big settings", "settings": {"n": big}})
+    assert response.status_code == 200
+    project_id = response.json()["id"]
+
+    response = test_client.get(f"/api/v1/projects/{project_id}/dashboard")
+    assert response.status_code == 200
+    assert response.json()["project"]["settings"] == {"n": big}
@@ -0,0 +1,61 @@
+"""
+Team API tests
+
+Team create and update, including member_agent_ids validation.
+"""
+
+from sqlalchemy import select
+
+from app.database.models import Agent, TeamMember
+
+
+def test_create_team_with_members(test_client, test_session, sample_project, sample_agent):
+    """Known member agents are stored, the lead with role "lead" and the rest as "member" """
+    other_agent = Agent(name="OtherAgent", agent_type_id=sample_agent.agent_type_id)
+    test_session.add(other_agent)
+    test_session.commit()
+
+    response = test_client.post("/api/v1/teams/", json={
+        "name": "Members Team",
+        "project_id": sample_project.id,
+        "team_lead_id": sample_agent.id,
+        "member_agent_ids": [sample_agent.id, other_agent.id]
+    })
+    assert response.status_code == 200
+    team_id = response.json()["id"]
+
+    members = test_session.execute(
+        select(TeamMember.agent_id, TeamMember.role, TeamMember.is_active)
+        .where(TeamMember.team_id == team_id)
+        .order_by(TeamMember.agent_id)
+    ).all()
+    assert [tuple(member) for member in members] == [
+        (sample_agent.id, "lead", True),
+        (other_agent.id, "member", True),
+    ]
+
+
+def test_create_team_with_unknown_member(test_client, sample_project, sample_agent):
+    """Unknown member_agent_ids are a 400 naming the missing ids, and no team is created"""
+    response = test_client.post("/api/v1/teams/", json={
+        "name": "Unknown Members Team",
+        "project_id": sample_project.id,
+        "member_agent_ids": [sample_agent.id, 999998, 999999]
+    })
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Agent not found: [999998, 999999]"
+
+    teams = test_client.get("/api/v1/teams/", params={"project_id": sample_project.id}).json()
+    assert "Unknown Members Team" not in [team["name"] for team in teams]
+
+
+def test_update_team_with_unknown_member(test_client, sample_team):
+    """An update naming an unknown member is a 400 and leaves the team unchanged"""
+    response = test_client.put(f"/api/v1/teams/{sample_team.id}", json={
+        "name": "Renamed Team",
+        "member_agent_ids": [999999]
+    })
+    assert response.status_code == 400
+
+    response = test_client.get(f"/api/v1/teams/{sample_team.id}")
+    assert response.json()["name"] == "Test Team"